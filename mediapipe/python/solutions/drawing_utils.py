@@ -172,8 +172,7 @@ def draw_landmarks(
     num_landmarks = len(landmark_list.landmark)
     # Draws the connections if the start and end landmarks are both visible.
     for connection in connections:
-      start_idx = connection[0]
-      end_idx = connection[1]
+      start_idx, end_idx = connection
       if not (0 <= start_idx < num_landmarks and 0 <= end_idx < num_landmarks):
         raise ValueError(f'Landmark index is out of range. Invalid connection '
                          f'from landmark #{start_idx} to landmark #{end_idx}.')
@@ -199,6 +198,65 @@ def draw_landmarks(
                  drawing_spec.color, drawing_spec.thickness)
 
 
+def draw_triangle_mesh(
+    image: np.ndarray,
+    landmark_list: landmark_pb2.NormalizedLandmarkList,
+    triangles: np.ndarray,
+    drawing_spec: DrawingSpec = DrawingSpec(thickness=1),
+):
+  """Draws the outlines of a triangle mesh on the image.
+
+  Unlike draw_landmarks, which issues one cv2.line call per connection, all
+  triangles are drawn with a single cv2.polylines call. Triangles with a
+  vertex that isn't visible or lies outside of the image are skipped.
+
+  Args:
+    image: A three channel BGR image represented as numpy ndarray.
+    landmark_list: A normalized landmark list proto message to be annotated on
+      the image.
+    triangles: A (T, 3) integer array of landmark indices, e.g.
+      `FaceLandmarksConnections.FACE_LANDMARKS_TESSELATION_TRIANGLES`.
+    drawing_spec: A DrawingSpec object that specifies the triangle outlines'
+      drawing settings such as color and line thickness.
+
+  Raises:
+    ValueError: If one of the followings:
+      a) If the input image is not three channel BGR.
+      b) If any triangle contains an invalid landmark index.
+  """
+  if not landmark_list:
+    return
+  if image.shape[2] != _BGR_CHANNELS:
+    raise ValueError('Input image must contain three channel bgr data.')
+  image_rows, image_cols, _ = image.shape
+  triangles = np.asarray(triangles, dtype=np.intp).reshape(-1, 3)
+  num_landmarks = len(landmark_list.landmark)
+  if triangles.size and (triangles.min() < 0 or
+                         triangles.max() >= num_landmarks):
+    raise ValueError('Landmark index is out of range. Invalid triangle in '
+                     'the triangle mesh.')
+  xy = np.empty((num_landmarks, 2), dtype=np.float64)
+  visible = np.empty(num_landmarks, dtype=bool)
+  for idx, landmark in enumerate(landmark_list.landmark):
+    xy[idx] = landmark.x, landmark.y
+    visible[idx] = not (
+        (landmark.HasField('visibility') and
+         landmark.visibility < _VISIBILITY_THRESHOLD) or
+        (landmark.HasField('presence') and
+         landmark.presence < _PRESENCE_THRESHOLD))
+  # Same mapping as _normalized_to_pixel_coordinates, for all landmarks at
+  # once.
+  visible &= np.all((xy >= 0) & (xy <= 1), axis=1)
+  points = np.minimum(
+      np.floor(xy * (image_cols, image_rows)),
+      (image_cols - 1, image_rows - 1)).astype(np.int32)
+  triangles = triangles[np.all(visible[triangles], axis=1)]
+  if not triangles.size:
+    return
+  cv2.polylines(image, points[triangles], True, drawing_spec.color,
+                drawing_spec.thickness)
+
+
 def draw_axis(image: np.ndarray,
               rotation: np.ndarray,
               translation: np.ndarray,
@@ -302,8 +360,7 @@ def plot_landmarks(landmark_list: landmark_pb2.NormalizedLandmarkList,
     num_landmarks = len(landmark_list.landmark)
     # Draws the connections if the start and end landmarks are both visible.
     for connection in connections:
-      start_idx = connection[0]
-      end_idx = connection[1]
+      start_idx, end_idx = connection
       if not (0 <= start_idx < num_landmarks and 0 <= end_idx < num_landmarks):
         raise ValueError(f'Landmark index is out of range. Invalid connection '
                          f'from landmark #{start_idx} to landmark #{end_idx}.')
@@ -152,6 +152,33 @@ class DrawingUtilTest(parameterized.TestCase):
         image=image, landmark_list=landmark_list, connections=[(0, 1)])
     np.testing.assert_array_equal(image, expected_result)
 
+  def test_draw_triangle_mesh(self):
+    landmark_list = text_format.Parse(
+        'landmark {x: 0.1 y: 0.5} landmark {x: 0.5 y: 0.1} '
+        'landmark {x: 0.5 y: 0.5} landmark {x: 0.9 y: 0.9 visibility: 0.1}',
+        landmark_pb2.NormalizedLandmarkList())
+    image = np.zeros((100, 100, 3), np.uint8)
+    expected_result = np.copy(image)
+    spec = drawing_utils.DrawingSpec(thickness=1)
+    cv2.polylines(expected_result, [np.array([[10, 50], [50, 10], [50, 50]],
+                                             np.int32)], True, spec.color,
+                  spec.thickness)
+    drawing_utils.draw_triangle_mesh(
+        image=image,
+        landmark_list=landmark_list,
+        triangles=np.array([[0, 1, 2], [1, 2, 3]]),
+        drawing_spec=spec)
+    np.testing.assert_array_equal(image, expected_result)
+
+  def test_draw_triangle_mesh_invalid_index(self):
+    landmark_list = text_format.Parse('landmark {x: 0.1 y: 0.5}',
+                                      landmark_pb2.NormalizedLandmarkList())
+    image = np.zeros((100, 100, 3), np.uint8)
+    with self.assertRaisesRegex(ValueError,
+                                'Landmark index is out of range.'):
+      drawing_utils.draw_triangle_mesh(
+          image=image, landmark_list=landmark_list, triangles=[[0, 1, 2]])
+
   def test_draw_axis(self):
     image = np.zeros((100, 100, 3), np.uint8)
     expected_result = np.copy(image)
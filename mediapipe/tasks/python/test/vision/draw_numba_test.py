@@ -0,0 +1,145 @@
+# Copyright 2023 The MediaPipe Authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests for the numba drawing kernels."""
+
+import importlib.util
+import sys
+from unittest import mock
+
+from absl.testing import absltest
+from absl.testing import parameterized
+import numpy as np
+
+from mediapipe.tasks.python.vision import _draw_numba
+from mediapipe.tasks.python.vision import face_landmarker
+
+
+def _load_draw_numba(use_numba: bool):
+  """Returns the module, or a fresh copy of it that runs without numba."""
+  if use_numba:
+    return _draw_numba
+  spec = importlib.util.find_spec(_draw_numba.__name__)
+  module = importlib.util.module_from_spec(spec)
+  with mock.patch.dict(sys.modules, {'numba': None}):
+    spec.loader.exec_module(module)
+  return module
+
+
+class DrawNumbaTest(parameterized.TestCase):
+
+  def _get_module(self, use_numba: bool):
+    if use_numba and _draw_numba.numba is None:
+      self.skipTest('numba is not installed.')
+    module = _load_draw_numba(use_numba)
+    self.assertEqual(module.numba is not None, use_numba)
+    return module
+
+  @parameterized.parameters(True, False)
+  def test_draw_edges(self, use_numba):
+    module = self._get_module(use_numba)
+    image = np.zeros((5, 5, 3), np.uint8)
+    points = np.array([[0, 0], [4, 0], [4, 4]], np.float32)
+    module.draw_edges(image, points, np.array([[0, 1], [1, 2]]), [255, 0, 0])
+    expected = np.zeros((5, 5, 3), np.uint8)
+    expected[0, :] = [255, 0, 0]
+    expected[:, 4] = [255, 0, 0]
+    np.testing.assert_array_equal(image, expected)
+
+  @parameterized.parameters(True, False)
+  def test_draw_edges_clips_to_image(self, use_numba):
+    module = self._get_module(use_numba)
+    image = np.zeros((5, 5, 3), np.uint8)
+    # Without clipping, these lines would take hours to step through.
+    points = np.array([[-1e12, 2], [1e12, 2], [2, -1e12], [2, 1e12]])
+    module.draw_edges(image, points, np.array([[0, 1], [2, 3]]), [255, 0, 0])
+    expected = np.zeros((5, 5, 3), np.uint8)
+    expected[2, :] = [255, 0, 0]
+    expected[:, 2] = [255, 0, 0]
+    np.testing.assert_array_equal(image, expected)
+
+  @parameterized.parameters(True, False)
+  def test_draw_edges_skips_lines_outside_image(self, use_numba):
+    module = self._get_module(use_numba)
+    image = np.zeros((5, 5, 3), np.uint8)
+    points = np.array([[-10, -1], [10, -1], [6, 0], [6, 4]])
+    module.draw_edges(image, points, np.array([[0, 1], [2, 3]]), [255, 0, 0])
+    np.testing.assert_array_equal(image, 0)
+
+  @parameterized.parameters(True, False)
+  def test_draw_edges_rejects_non_finite_points(self, use_numba):
+    module = self._get_module(use_numba)
+    image = np.zeros((5, 5, 3), np.uint8)
+    for value in (np.inf, -np.inf, np.nan):
+      points = np.array([[0, 0], [value, 0]])
+      with self.assertRaisesRegex(ValueError, 'finite'):
+        module.draw_edges(image, points, np.array([[0, 1]]), [255, 0, 0])
+
+  @parameterized.parameters(True, False)
+  def test_draw_edges_rejects_out_of_range_edges(self, use_numba):
+    module = self._get_module(use_numba)
+    image = np.zeros((5, 5, 3), np.uint8)
+    points = np.zeros((3, 2))
+    for edges in ([[0, 10**6]], [[0, 3]], [[-1, 0]]):
+      with self.assertRaisesRegex(ValueError, 'out of range'):
+        module.draw_edges(image, points, np.array(edges), [255, 0, 0])
+    np.testing.assert_array_equal(image, 0)
+
+  @parameterized.parameters(True, False)
+  def test_draw_edges_rejects_bad_shapes(self, use_numba):
+    module = self._get_module(use_numba)
+    image = np.zeros((5, 5, 3), np.uint8)
+    edges = np.array([[0, 1]])
+    with self.assertRaisesRegex(ValueError, 'points'):
+      module.draw_edges(image, np.zeros((3, 3)), edges, [255, 0, 0])
+    with self.assertRaisesRegex(ValueError, 'color'):
+      module.draw_edges(image, np.zeros((3, 2)), edges, [255, 0])
+    with self.assertRaisesRegex(ValueError, 'image'):
+      module.draw_edges(np.zeros((5, 5), np.uint8), np.zeros((3, 2)), edges,
+                        [255, 0, 0])
+
+  @parameterized.parameters(True, False)
+  def test_edges_to_segments(self, use_numba):
+    module = self._get_module(use_numba)
+    landmarks = np.arange(15, dtype=np.float32).reshape(5, 3)
+    edges = np.array([[0, 4], [3, 1]], np.uint16)
+    np.testing.assert_array_equal(
+        module.edges_to_segments(landmarks, edges),
+        [[0, 1, 12, 13], [9, 10, 3, 4]],
+    )
+
+  @parameterized.parameters(True, False)
+  def test_edges_to_segments_accepts_read_only_arrays(self, use_numba):
+    module = self._get_module(use_numba)
+    connections = face_landmarker.FaceLandmarksConnections
+    edges = connections.FACE_LANDMARKS_TESSELATION_UNIQUE.edges
+    self.assertFalse(edges.flags.writeable)
+    landmarks = np.random.default_rng(0).random((478, 3), dtype=np.float32)
+    landmarks.flags.writeable = False
+    segments = module.edges_to_segments(landmarks, edges)
+    np.testing.assert_array_equal(
+        segments[:, :2], landmarks[edges[:, 0].astype(np.intp), :2])
+    np.testing.assert_array_equal(
+        segments[:, 2:], landmarks[edges[:, 1].astype(np.intp), :2])
+
+  @parameterized.parameters(True, False)
+  def test_edges_to_segments_rejects_out_of_range_edges(self, use_numba):
+    module = self._get_module(use_numba)
+    landmarks = np.zeros((3, 3), np.float32)
+    for edges in ([[0, 10**6]], [[0, 3]], [[-1, 0]]):
+      with self.assertRaisesRegex(ValueError, 'out of range'):
+        module.edges_to_segments(landmarks, np.array(edges))
+
+
+if __name__ == '__main__':
+  absltest.main()
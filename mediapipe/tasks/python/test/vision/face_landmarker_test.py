@@ -13,6 +13,8 @@
 # limitations under the License.
 """Tests for face landmarker."""
 
+import collections
+import dataclasses
 import enum
 from unittest import mock
 
@@ -42,6 +44,7 @@ _Landmark = landmark_module.Landmark
 _NormalizedLandmark = landmark_module.NormalizedLandmark
 _Image = image_module.Image
 _FaceLandmarker = face_landmarker.FaceLandmarker
+_FaceLandmarksConnections = face_landmarker.FaceLandmarksConnections
 _FaceLandmarkerOptions = face_landmarker.FaceLandmarkerOptions
 _RUNNING_MODE = running_mode_module.VisionTaskRunningMode
 _ImageProcessingOptions = image_processing_options_module.ImageProcessingOptions
@@ -54,6 +57,7 @@ _PORTRAIT_EXPECTED_BLENDSHAPES = 'portrait_expected_blendshapes.pbtxt'
 _LANDMARKS_MARGIN = 0.03
 _BLENDSHAPES_MARGIN = 0.13
 _FACIAL_TRANSFORMATION_MATRIX_MARGIN = 0.02
+_NUM_FACE_LANDMARKS = 478
 
 
 def _get_expected_face_landmarks(file_path: str):
@@ -244,10 +248,21 @@ class FaceLandmarkerTest(parameterized.TestCase):
       self._expect_landmarks_correct(
           detection_result.face_landmarks, expected_face_landmarks
       )
+      np.testing.assert_array_equal(
+          detection_result.face_landmarks_array,
+          [[[landmark.x, landmark.y, landmark.z] for landmark in face]
+           for face in detection_result.face_landmarks],
+      )
+      self.assertTrue(detection_result.face_landmarks_array.flags.c_contiguous)
     if expected_face_blendshapes is not None:
       self._expect_blendshapes_correct(
           detection_result.face_blendshapes, expected_face_blendshapes
       )
+      np.testing.assert_array_equal(
+          detection_result.face_blendshapes_array,
+          [[category.score for category in face_blendshapes]
+           for face_blendshapes in detection_result.face_blendshapes],
+      )
     if expected_facial_transformation_matrixes is not None:
       self._expect_facial_transformation_matrixes_correct(
           detection_result.facial_transformation_matrixes,
@@ -561,5 +576,316 @@ class FaceLandmarkerTest(parameterized.TestCase):
         landmarker.detect_async(test_image, timestamp)
 
 
+class BlendshapesTest(absltest.TestCase):
+
+  def test_blendshape_name(self):
+    for blendshape in face_landmarker.Blendshapes:
+      self.assertEqual(
+          face_landmarker.blendshape_name(blendshape), blendshape.name
+      )
+    for index in (-1, len(face_landmarker.Blendshapes)):
+      with self.assertRaises(ValueError):
+        face_landmarker.blendshape_name(index)
+
+
+def _make_classification_list() -> classification_pb2.ClassificationList:
+  return text_format.Parse(
+      """
+      classification { index: 0 score: 0.25 label: "_neutral" }
+      classification { index: 1 score: 0.5 label: "browDownLeft" }
+      classification {
+        index: 2 score: 0.1 label: "browDownRight" display_name: "brow"
+      }
+      """,
+      classification_pb2.ClassificationList(),
+  )
+
+
+def _make_normalized_landmark_list() -> landmark_pb2.NormalizedLandmarkList:
+  return text_format.Parse(
+      """
+      landmark { x: 0.1 y: 0.2 z: -0.3 }
+      landmark { x: 0.4 y: 0.5 z: 0.6 visibility: 0.7 presence: 0.8 }
+      landmark { x: 0.9 y: 1.0 z: 1.1 }
+      """,
+      landmark_pb2.NormalizedLandmarkList(),
+  )
+
+
+class FaceLandmarkerResultContainersTest(absltest.TestCase):
+
+  def test_build_result_landmarks(self):
+    proto = _make_normalized_landmark_list()
+    # The packets are stood in for by their stream names.
+    output_packets = {'norm_landmarks': 'norm_landmarks'}
+    protos = {'norm_landmarks': [proto, proto]}
+    with mock.patch.object(
+        face_landmarker.packet_getter, 'get_proto_list',
+        side_effect=protos.__getitem__):
+      result = face_landmarker._build_landmarker_result(output_packets)
+
+    expected = [
+        _NormalizedLandmark.create_from_pb2(landmark)
+        for landmark in proto.landmark
+    ]
+    self.assertEqual(result.face_landmarks, [expected, expected])
+    self.assertIsInstance(result.face_landmarks[0], list)
+    self.assertEqual(
+        dataclasses.asdict(result)['face_landmarks'][0][1],
+        dataclasses.asdict(expected[1]),
+    )
+    landmark = result.face_landmarks[0][0]
+    landmark.x *= 2
+    self.assertIs(result.face_landmarks[0][0], landmark)
+    self.assertEqual(result.face_landmarks[0][0].x, landmark.x)
+    self.assertEqual(result.face_blendshapes, [])
+    self.assertIsNone(result.face_blendshapes_array)
+    self.assertEqual(result.face_landmarks_array.shape, (2, 3, 3))
+    self.assertTrue(result.face_landmarks_array.flags.c_contiguous)
+    np.testing.assert_array_equal(
+        result.face_landmarks_array[1],
+        np.array([[0.1, 0.2, -0.3], [0.4, 0.5, 0.6], [0.9, 1.0, 1.1]],
+                 np.float32),
+    )
+
+  def test_build_result_blendshapes(self):
+    proto = _make_classification_list()
+    # The packets are stood in for by their stream names.
+    output_packets = {'norm_landmarks': 'norm_landmarks',
+                      'blendshapes': 'blendshapes'}
+    protos = {'norm_landmarks': [], 'blendshapes': [proto, proto]}
+    with mock.patch.object(
+        face_landmarker.packet_getter, 'get_proto_list',
+        side_effect=protos.__getitem__):
+      result = face_landmarker._build_landmarker_result(output_packets)
+
+    expected = [
+        _Category.create_from_pb2(classification)
+        for classification in proto.classification
+    ]
+    self.assertEqual(result.face_blendshapes, [expected, expected])
+    self.assertIsInstance(result.face_blendshapes[0], list)
+    result.face_blendshapes[0][1].score = 1.0
+    self.assertEqual(result.face_blendshapes[0][1].score, 1.0)
+    self.assertEqual(result.face_blendshapes_array.dtype, np.float32)
+    np.testing.assert_array_equal(
+        result.face_blendshapes_array,
+        np.array([[0.25, 0.5, 0.1]] * 2, np.float32),
+    )
+
+
+class FaceLandmarksConnectionsTest(parameterized.TestCase):
+
+  @parameterized.parameters(
+      'FACE_LANDMARKS_LIPS',
+      'FACE_LANDMARKS_LEFT_EYE',
+      'FACE_LANDMARKS_LEFT_EYEBROW',
+      'FACE_LANDMARKS_LEFT_IRIS',
+      'FACE_LANDMARKS_RIGHT_EYE',
+      'FACE_LANDMARKS_RIGHT_EYEBROW',
+      'FACE_LANDMARKS_RIGHT_IRIS',
+      'FACE_LANDMARKS_FACE_OVAL',
+      'FACE_LANDMARKS_CONTOURS',
+      'FACE_LANDMARKS_TESSELATION',
+      'FACE_LANDMARKS_TESSELATION_UNIQUE',
+  )
+  def test_connections_are_valid(self, name):
+    connections = getattr(_FaceLandmarksConnections, name)
+    self.assertNotEmpty(connections)
+    for connection in connections:
+      self.assertIsInstance(connection, _FaceLandmarksConnections.Connection)
+      self.assertBetween(connection.start, 0, _NUM_FACE_LANDMARKS - 1)
+      self.assertBetween(connection.end, 0, _NUM_FACE_LANDMARKS - 1)
+
+  def test_connections_match_edges(self):
+    connections = _FaceLandmarksConnections.FACE_LANDMARKS_TESSELATION
+    edges = connections.edges
+    self.assertEqual(edges.shape, (len(connections), 2))
+    self.assertEqual(
+        [(c.start, c.end) for c in connections],
+        [tuple(edge) for edge in edges.tolist()],
+    )
+    self.assertEqual(
+        connections[-1], _FaceLandmarksConnections.Connection(255, 339)
+    )
+
+  def test_connection_is_a_tuple(self):
+    connection = _FaceLandmarksConnections.Connection(61, 146)
+    self.assertEqual(connection, (61, 146))
+    self.assertEqual((connection.start, connection.end), tuple(connection))
+    with self.assertRaises(AttributeError):
+      connection.start = 0
+
+  def test_connections_are_interned(self):
+    lips = _FaceLandmarksConnections.FACE_LANDMARKS_LIPS
+    contours = _FaceLandmarksConnections.FACE_LANDMARKS_CONTOURS
+    self.assertIs(lips[0], next(iter(contours)))
+    self.assertIs(lips[0], next(iter(lips)))
+    self.assertIs(
+        _FaceLandmarksConnections.connection(*lips[0]), lips[0])
+    self.assertIs(
+        _FaceLandmarksConnections.connection(np.uint16(146), 91), lips[1])
+    outside = _FaceLandmarksConnections.connection(0, _NUM_FACE_LANDMARKS)
+    self.assertEqual(outside, (0, _NUM_FACE_LANDMARKS))
+    self.assertIsNot(
+        _FaceLandmarksConnections.connection(0, _NUM_FACE_LANDMARKS), outside)
+
+  def test_sequence_methods_match_list(self):
+    lips = _FaceLandmarksConnections.FACE_LANDMARKS_LIPS
+    expected = list(lips)
+    self.assertIn((61, 146), lips)
+    self.assertNotIn((146, 61), lips)
+    self.assertNotIn([61, 146], lips)
+    self.assertIn((61.0, np.uint16(146)), lips)
+    self.assertNotIn((61, 146 + (1 << 16)), lips)
+    self.assertEqual(lips.index(expected[5], 3), 5)
+    self.assertEqual(lips.count(expected[0]), 1)
+    self.assertEqual(list(reversed(lips)), expected[::-1])
+    with self.assertRaises(ValueError):
+      lips.index((146, 61))
+
+  def test_equality_and_concatenation_match_list(self):
+    lips = _FaceLandmarksConnections.FACE_LANDMARKS_LIPS
+    left_eye = _FaceLandmarksConnections.FACE_LANDMARKS_LEFT_EYE
+    expected = list(lips)
+    self.assertEqual(lips, lips[:])
+    self.assertEqual(lips, expected)
+    self.assertEqual(expected, lips)
+    self.assertEqual(lips, [tuple(edge) for edge in lips.edges.tolist()])
+    self.assertNotEqual(lips, lips[1:])
+    self.assertNotEqual(lips, left_eye)
+    self.assertNotEqual(lips, lips.edges.tolist())
+    with self.assertRaises(TypeError):
+      hash(lips)
+    self.assertEqual([] + lips, expected)
+    self.assertEqual(expected + lips, expected + expected)
+    self.assertEqual(lips + left_eye, expected + list(left_eye))
+
+  def test_tesselation_unique_has_each_undirected_edge_once(self):
+    tesselation = _FaceLandmarksConnections.FACE_LANDMARKS_TESSELATION
+    unique = _FaceLandmarksConnections.FACE_LANDMARKS_TESSELATION_UNIQUE
+    expected = {tuple(sorted(edge)) for edge in tesselation.edges.tolist()}
+    self.assertLen(unique, len(expected))
+    self.assertEqual({(c.start, c.end) for c in unique}, expected)
+
+  def test_tesselation_triangles_match_edges(self):
+    triangles = _FaceLandmarksConnections.FACE_LANDMARKS_TESSELATION_TRIANGLES
+    edges = _FaceLandmarksConnections.FACE_LANDMARKS_TESSELATION.edges
+    self.assertEqual(triangles.shape, (len(edges) // 3, 3))
+    np.testing.assert_array_equal(
+        triangles[:, [0, 1, 1, 2, 2, 0]].reshape(-1, 2), edges
+    )
+
+  def test_tesselation_triangles_form_oriented_mesh(self):
+    triangles = _FaceLandmarksConnections.FACE_LANDMARKS_TESSELATION_TRIANGLES
+    self.assertEqual(triangles.dtype, np.uint16)
+    self.assertTrue(triangles.flags.c_contiguous)
+    self.assertFalse(triangles.flags.writeable)
+    # The mesh covers the 468 face landmarks, not the 10 iris landmarks.
+    self.assertLess(triangles.max(), 468)
+    self.assertTrue(
+        np.all(triangles != np.roll(triangles, 1, axis=1)),
+        'Found a degenerate triangle.',
+    )
+    # Consistently oriented triangles never share a directed edge, and each
+    # undirected edge borders one or two triangles.
+    edges = triangles[:, [0, 1, 1, 2, 2, 0]].reshape(-1, 2).tolist()
+    self.assertLen(set(map(tuple, edges)), len(edges))
+    counts = collections.Counter(tuple(sorted(edge)) for edge in edges)
+    self.assertLessEqual(max(counts.values()), 2)
+
+  def test_gather_edge_endpoints(self):
+    connections = _FaceLandmarksConnections.FACE_LANDMARKS_LIPS
+    landmarks = np.arange(_NUM_FACE_LANDMARKS * 3, dtype=np.float32).reshape(
+        -1, 3
+    )
+    starts, ends = face_landmarker.gather_edge_endpoints(landmarks, connections)
+    for i, connection in enumerate(connections):
+      np.testing.assert_array_equal(starts[i], landmarks[connection.start])
+      np.testing.assert_array_equal(ends[i], landmarks[connection.end])
+
+  def test_tesselation_neighbors(self):
+    unique = _FaceLandmarksConnections.FACE_LANDMARKS_TESSELATION_UNIQUE
+    expected = {i: set() for i in range(_NUM_FACE_LANDMARKS)}
+    for start, end in unique:
+      expected[start].add(end)
+      expected[end].add(start)
+    for i in range(_NUM_FACE_LANDMARKS):
+      neighbors = _FaceLandmarksConnections.tesselation_neighbors(i).tolist()
+      self.assertEqual(neighbors, sorted(expected[i]))
+
+  def test_has_edge(self):
+    unique = _FaceLandmarksConnections.FACE_LANDMARKS_TESSELATION_UNIQUE
+    expected = set(unique)
+    for start in range(_NUM_FACE_LANDMARKS):
+      for end in range(start, _NUM_FACE_LANDMARKS):
+        has_edge = (start, end) in expected
+        self.assertEqual(
+            _FaceLandmarksConnections.has_edge(start, end), has_edge)
+        self.assertEqual(
+            _FaceLandmarksConnections.has_edge(end, start), has_edge)
+    for start in range(_NUM_FACE_LANDMARKS):
+      for end in _FaceLandmarksConnections.tesselation_neighbors(start):
+        self.assertTrue(_FaceLandmarksConnections.has_edge(start, end))
+        self.assertTrue(_FaceLandmarksConnections.has_edge(end, start))
+    self.assertFalse(
+        _FaceLandmarksConnections.has_edge(np.uint16(0), np.uint16(1)))
+    self.assertFalse(_FaceLandmarksConnections.has_edge(-1, 0))
+    self.assertFalse(
+        _FaceLandmarksConnections.has_edge(0, _NUM_FACE_LANDMARKS))
+
+  @parameterized.parameters(
+      'FACE_LANDMARKS_LIPS',
+      'FACE_LANDMARKS_LEFT_IRIS',
+      'FACE_LANDMARKS_CONTOURS',
+      'FACE_LANDMARKS_TESSELATION',
+  )
+  def test_contains_landmark(self, name):
+    connections = getattr(_FaceLandmarksConnections, name)
+    landmarks = {index for connection in connections for index in connection}
+    for index in range(-1, _NUM_FACE_LANDMARKS + 1):
+      self.assertEqual(
+          connections.contains_landmark(index), index in landmarks)
+    self.assertEqual(
+        connections.landmark_mask, sum(1 << index for index in landmarks))
+    for start, end in connections.edges:
+      self.assertTrue(connections.contains_landmark(start))
+      self.assertTrue(connections.contains_landmark(end))
+
+  def test_tesselation_edge_indices(self):
+    unique = _FaceLandmarksConnections.FACE_LANDMARKS_TESSELATION_UNIQUE
+    contours = _FaceLandmarksConnections.FACE_LANDMARKS_CONTOURS
+    indices = _FaceLandmarksConnections.tesselation_edge_indices(contours)
+    np.testing.assert_array_equal(
+        unique.edges[indices], np.sort(contours.edges, axis=1))
+    with self.assertRaisesRegex(ValueError, 'not an edge of the tesselation'):
+      _FaceLandmarksConnections.tesselation_edge_indices(
+          _FaceLandmarksConnections.FACE_LANDMARKS_LEFT_IRIS)
+
+  def test_tesselation_degrees(self):
+    degrees = _FaceLandmarksConnections.tesselation_degrees()
+    self.assertEqual(degrees.shape, (_NUM_FACE_LANDMARKS,))
+    for i in range(_NUM_FACE_LANDMARKS):
+      self.assertLen(_FaceLandmarksConnections.tesselation_neighbors(i),
+                     degrees[i])
+
+  def test_incident_triangles(self):
+    triangles = _FaceLandmarksConnections.FACE_LANDMARKS_TESSELATION_TRIANGLES
+    for i in range(_NUM_FACE_LANDMARKS):
+      expected = np.flatnonzero((triangles == i).any(axis=1))
+      np.testing.assert_array_equal(
+          _FaceLandmarksConnections.incident_triangles(i), expected)
+
+  @parameterized.parameters('tesselation_neighbors', 'incident_triangles')
+  def test_landmark_lookups_check_index(self, method_name):
+    method = getattr(_FaceLandmarksConnections, method_name)
+    np.testing.assert_array_equal(method(np.uint16(10)), method(10))
+    for index in (-1, _NUM_FACE_LANDMARKS):
+      with self.assertRaisesRegex(ValueError, 'out of range'):
+        method(index)
+    with self.assertRaises(TypeError):
+      method(1.0)
+
+
 if __name__ == '__main__':
   absltest.main()
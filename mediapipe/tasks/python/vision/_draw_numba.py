@@ -0,0 +1,222 @@
+# Copyright 2023 The MediaPipe Authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Numba kernels for drawing landmark connections.
+
+Numba isn't a dependency of the mediapipe pip package. When it is installed,
+the kernels below are compiled to native code so that all connections of a
+face mesh can be drawn without a per-connection Python loop. Otherwise they
+run as plain Python, which is correct but slow, except for
+`edges_to_segments`, which falls back to numpy indexing.
+"""
+
+from typing import Tuple
+
+import numpy as np
+
+try:
+  import numba  # pylint: disable=g-import-not-at-top
+except ModuleNotFoundError:
+  numba = None
+
+if numba is not None:
+  _jit = numba.njit
+  _prange = numba.prange
+else:
+  _jit = lambda **unused_kwargs: lambda fn: fn
+  _prange = range
+
+
+@_jit(cache=True)
+def _draw_line(
+    image: np.ndarray, x0: int, y0: int, x1: int, y1: int, color: np.ndarray
+) -> None:
+  """Draws a one pixel wide line with Bresenham's algorithm, clipped."""
+  height, width = image.shape[0], image.shape[1]
+  dx = abs(x1 - x0)
+  dy = -abs(y1 - y0)
+  step_x = 1 if x0 < x1 else -1
+  step_y = 1 if y0 < y1 else -1
+  error = dx + dy
+  while True:
+    if 0 <= x0 < width and 0 <= y0 < height:
+      image[y0, x0, :] = color
+    if x0 == x1 and y0 == y1:
+      break
+    error2 = 2 * error
+    if error2 >= dy:
+      error += dy
+      x0 += step_x
+    if error2 <= dx:
+      error += dx
+      y0 += step_y
+
+
+@_jit(cache=True)
+def _clip_range(
+    p: float, q: float, t0: float, t1: float
+) -> Tuple[float, float]:
+  """Narrows `[t0, t1]` to the `t` with `p * t <= q`; empty if `t0 > t1`."""
+  if p == 0.0:
+    return (t0, t1) if q >= 0.0 else (1.0, 0.0)
+  r = q / p
+  if p < 0.0:
+    return max(t0, r), t1
+  return t0, min(t1, r)
+
+
+@_jit(cache=True)
+def _draw_segment(
+    image: np.ndarray,
+    x0: float,
+    y0: float,
+    x1: float,
+    y1: float,
+    color: np.ndarray,
+) -> None:
+  """Clips a segment to the image (Liang-Barsky), then draws it.
+
+  Clipping first bounds the number of pixels that `_draw_line` steps through
+  by the image size, however far outside the image the points are.
+  """
+  # The segment is clipped to the area of the pixels that it may round to.
+  x_max = image.shape[1] - 0.5
+  y_max = image.shape[0] - 0.5
+  dx = x1 - x0
+  dy = y1 - y0
+  t0, t1 = _clip_range(-dx, x0 + 0.5, 0.0, 1.0)
+  t0, t1 = _clip_range(dx, x_max - x0, t0, t1)
+  t0, t1 = _clip_range(-dy, y0 + 0.5, t0, t1)
+  t0, t1 = _clip_range(dy, y_max - y0, t0, t1)
+  if t0 > t1:
+    return
+  _draw_line(
+      image,
+      int(round(x0 + t0 * dx)),
+      int(round(y0 + t0 * dy)),
+      int(round(x0 + t1 * dx)),
+      int(round(y0 + t1 * dy)),
+      color,
+  )
+
+
+@_jit(cache=True, parallel=True)
+def _draw_edges_kernel(
+    image: np.ndarray, points: np.ndarray, edges: np.ndarray, color: np.ndarray
+) -> None:
+  for i in _prange(edges.shape[0]):
+    start = edges[i, 0]
+    end = edges[i, 1]
+    _draw_segment(
+        image,
+        points[start, 0],
+        points[start, 1],
+        points[end, 0],
+        points[end, 1],
+        color,
+    )
+
+
+def _check_edges(edges: np.ndarray, num_landmarks: int) -> np.ndarray:
+  """Returns the edges as an (E, 2) array, checking the landmark indices."""
+  edges = np.asarray(edges)
+  if edges.size and not np.issubdtype(edges.dtype, np.integer):
+    raise ValueError('Edges must be integer landmark indices.')
+  edges = edges.reshape(-1, 2)
+  # The compiled kernels don't check bounds.
+  if edges.size and (edges.min() < 0 or edges.max() >= num_landmarks):
+    raise ValueError('Landmark index is out of range.')
+  return edges
+
+
+def draw_edges(
+    image: np.ndarray, points: np.ndarray, edges: np.ndarray, color: np.ndarray
+) -> None:
+  """Draws a line for each edge onto the image, in place.
+
+  Args:
+    image: (H, W, C) uint8 image to draw on.
+    points: (N, 2) array of landmark positions as (x, y) pixel coordinates.
+    edges: (E, 2) integer array of `[start, end]` landmark indices, e.g.
+      `FaceLandmarksConnections.FACE_LANDMARKS_TESSELATION_UNIQUE.edges`.
+    color: (C,) uint8 array with the line color.
+
+  Raises:
+    ValueError: If the arrays have the wrong shapes, the image is read-only, a
+      point isn't finite or an edge refers to a landmark that doesn't exist.
+  """
+  if image.ndim != 3 or not image.flags.writeable:
+    raise ValueError('The image must be a writable (H, W, C) array.')
+  points = np.asarray(points, dtype=np.float64)
+  if points.ndim != 2 or points.shape[1] != 2:
+    raise ValueError('The points must be an (N, 2) array.')
+  # The compiled kernel can't be interrupted, and never finishes stepping
+  # towards an infinite or NaN point.
+  if not np.isfinite(points).all():
+    raise ValueError('The points must be finite.')
+  color = np.asarray(color, dtype=image.dtype)
+  if color.shape != image.shape[2:]:
+    raise ValueError('The color must have one value per image channel.')
+  edges = _check_edges(edges, points.shape[0])
+  _draw_edges_kernel(image, points, edges, color)
+
+
+if numba is not None:
+
+  # The explicit signature compiles the kernel eagerly for the dtypes that
+  # `edges_to_segments` passes, instead of on the first call. It only
+  # accepts writable arrays, so `edges_to_segments` copies read-only ones.
+  @numba.njit('f4[:, :](f4[:, :], i8[:, :])', cache=True)
+  def _edges_to_segments(
+      landmarks: np.ndarray, edges: np.ndarray
+  ) -> np.ndarray:
+    segments = np.empty((edges.shape[0], 4), np.float32)
+    for i in range(edges.shape[0]):
+      start = edges[i, 0]
+      end = edges[i, 1]
+      segments[i, 0] = landmarks[start, 0]
+      segments[i, 1] = landmarks[start, 1]
+      segments[i, 2] = landmarks[end, 0]
+      segments[i, 3] = landmarks[end, 1]
+    return segments
+
+else:
+
+  def _edges_to_segments(
+      landmarks: np.ndarray, edges: np.ndarray
+  ) -> np.ndarray:
+    return landmarks[edges.ravel(), :2].reshape(-1, 4)
+
+
+def edges_to_segments(landmarks: np.ndarray, edges: np.ndarray) -> np.ndarray:
+  """Returns the 2D line segment of every edge.
+
+  Args:
+    landmarks: (N, 2) or (N, 3) array of landmark coordinates, e.g. a face of
+      `FaceLandmarkerResult.face_landmarks_array`.
+    edges: (E, 2) integer array of `[start, end]` landmark indices, e.g.
+      `FaceLandmarksConnections.FACE_LANDMARKS_TESSELATION_UNIQUE.edges`.
+
+  Returns:
+    An (E, 4) float32 array with the `x0, y0, x1, y1` coordinates of each edge.
+
+  Raises:
+    ValueError: If the landmarks have the wrong shape or an edge refers to a
+      landmark that doesn't exist.
+  """
+  landmarks = np.require(landmarks, dtype=np.float32, requirements='W')
+  if landmarks.ndim != 2 or landmarks.shape[1] < 2:
+    raise ValueError('The landmarks must be an (N, 2) or (N, 3) array.')
+  edges = _check_edges(edges, landmarks.shape[0])
+  edges = np.require(edges, dtype=np.int64, requirements='W')
+  return _edges_to_segments(landmarks, edges)
@@ -0,0 +1,258 @@
+# Copyright 2023 The MediaPipe Authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Encoded face mesh tesselation data for the face landmarker task.
+
+The data lives in its own module so that it is only loaded when the
+tesselation is first used, rather than whenever `face_landmarker` is imported.
+To change the mesh, regenerate it with `tools/gen_face_landmarker_data.py`.
+"""
+
+import zlib
+
+import numpy as np
+
+_NUM_FACE_LANDMARKS = 478
+
+# The encoded literals below are generated by
+# tools/gen_face_landmarker_data.py and must not be edited by hand.
+
+# The face mesh tesselation as 852 triangles of three landmark indices each.
+# The flattened indices are delta-encoded, zig-zag mapped to non-negative
+# integers, written as LEB128 varints and zlib-compressed; see
+# `_decode_varints`. Most consecutive indices are close to each other, so this
+# is several times smaller than the raw indices, which keeps this module cheap
+# to compile and import. It is only decoded when the tesselation is first
+# accessed.
+_TRIANGLES_ENCODED = (
+    b'x\xda-W\tT\x95e\x1a\xf6y\xbe\xef^@\xd6\x02\x0c\xe1\xb2\xaa\xb8\xa5h\x80'
+    b'\xda\xb8!\x8bK \xe0\x82\xcb\x94\xa6\xa5\x01\x965\xd8h:\xa5\xb1\x83\x0b'
+    b'\xb8 \xc8.0\x82\xa8L)&\x08\xee\xb8L\xa0h\xb8\xa0\x99{\x8b)\x83\x8aZ\xe3T'
+    b'\xca\xbc\xcc\x99\xc39\xff\xe1\x9e{\xff\xef\xff\xbeg}\xff\x17\xa8\xc3yt'
+    b'\xc2\xf1\x8dT\x85\xebx;DW\xc3:\x0b\x8fy\x1d6>!\xea\n\xcc\x06\x8dL\xc3{'
+    b'\xc3\x838\xba\x90Q\x9f\xa4\xc2c\x95\x83\xcdF\x06\x95\xb1\x05\xa1\xf9,b'
+    b'\xccA\xcc\x92\x1b+\xe1\xa0S\x98\x00,s\xdd\tS\n\xe9\xd7\x04\x8f\x14\x9c'
+    b'\x80\xfd\xd2b\x0c\xec\x11\x9a\x82<,0xZN\xc9\xe5C\xe0\x835X\xfc\x03\xf6q'
+    b'\x13Mh\xe3&\xb8\xe5\xa2\x16\xfc\nG\x80\x14\xfcFC3oa\xf0\xe8\xb7\xa3\xf1'
+    b'\x15\xcd>\xdc\x01$\xb1Fa\x07r\xd0\xa2\x12U\x01M\x13\xab1\xf4\x08\xaf\xe2'
+    b'\x06V\xab\x834\xcf\xe2\x0c\xe8aEX\x94\x8c\x7f \x87+\xe5<\x0fx\x84\xdb`NS3'
+    b'\x8aQ\x03\xabK\xa4\xadU\x05\xf21e\xe4F\xe8\xf0\x04\xacr\xcd\x913\xf2\xa2<'
+    b'\xf3>\x1e\xd2\x1eO\xb9W\x1dTijH\x15\n\xe0\x1e\xfc\xae\x8dC\t\xbeE\xa2:'
+    b'\x07K\xcb\x14\x94\xe1\x02\xaa\xd5i\x94\xa3I~\xbb\x10)\xf4R\xc9\x0c\xa4'
+    b'\xcdeYbZT\r\xed\xdb\x18\x19\x9e\x81d\xe2\t^\xf06\xe6"\x8dw\xa8\xec\x8e'
+    b'\xe1\x16~\xa4\xe10\xb5\xec\x9b\xcb]\xac\xb3a\x08Ne\x16\x9c\x0b\x10\\\xc8'
+    b'\xe7\\\x14:(\x80\x9bi\xfeR#\x03\xae\xc1\x95S\xa7\xf4\x1f\x96\x81\xc9\xc6E'
+    b'wq\x82\xb3\x87D\xeeC\x1f\xe7\xa1\xf61\xbd\x04\x9e"\xa0_\xdct8\xce\xfa\n'
+    b'\xdbU&0\xcb?6d\x130z\x0ek\x10\xbb\x19C\x9e\x00\xc9]0~\xcb\x9f\xb1\x19\x97'
+    b'a\xc3\xe9\xc1\x13\x8aQ\xc7\x1f\x10\x97\x82V\xdef\x98\xfc\xdb\xc9y\xb6g'
+    b'\x05\xcdk0\x1f\xd2\x06\xcet\xb3\xfe\x89\xa5\xf0\x8e\xfd\xd8\x99\xa7(T\x96'
+    b'\xa3\x1e\xadx\x0eN\x8e\xc4\x8cfx\xb4\xf2[z\xdc\xc1\xa7%\xf2\x8d\xeb\x16\\'
+    b'\x81\xaf\xd5F\\a\x1d{\x8e\xbb\x08\x8f\x12\x9c\xa6\xc3\xa7\xf1J_f/\xbf_'
+    b'\xe9\x95\xa0\xfc\x98\x0e\xcfL\xc4\xe8{8\x86\xb0w\xf3i\x87>a.\xaf\xf6\x1by'
+    b'\x00{q\x18\xeb\xe0\xeb\xfe\xb3\xa8\xc1\x98\xc4\xf1A\xbe~\xb3VcAwc\x8d\x00'
+    b'\x91\x0b\xfb\x855\xe4\xf7\xd8\x84Y\x8e\xde\xd1z-~E\x0b\xbav\xda?\x95f0'
+    b'\xfa\x17!x\x80gD\xd8\x1b7Y\x8fRa\xe6\x1f\x94s\xd7A>\x1d\x02\x0f\xcb\xc3'
+    b'\xd8\x80~m8\x85\xd93\xc3?ry,D\xb8]\x91s\x98?\xc3\xb0}L\xe4\x08\xeb\xbe{D3'
+    b'\xcey8J\xf5=L\x91\xab\x19e\\\xa3\xac\x8f3 lX%t\x9e\xe0\xdb\x8aE\x83\x8b'
+    b'\xa8\x0ea?\xe6&\xc1\xfd\x16\xcbU\x15\xfe\x85lu\x1eG\xe5\xca|U\xa4X\xac'
+    b'\xb6(\xb32\xd5\x8e](TQ\\4\xb0\x91\xebx\x9c#\x9a\x98\xa4\x98\xac\x12\x94J'
+    b'\x97\x0bR\xd5\xe0=*U9\x1f\xe2\xd2m\xbc\x04\x0fW\xb7&\xd6aTX\x8aZ\xf6\x05'
+    b'\x06D$\xa3\x11\x8f\xd1\xc3\xb1E\xf4w\x0f.\x9b\x91%g\x8d\x8ar?\x0fC\x9f0'
+    b'\xf1\x8bq\xc6\xec,\xec\x14\x16\xab\xe1\xb2\xa8\x96\xf5\xaa\xad\xcb\x01'
+    b'\x86\xc0\xfe\x8d\x86S:\xe41O\x03s\x18\xb4\x1b.I\xb8A\x1e\x81\x0fB\x9e`P'
+    b'\x83\x1a\xc9^\xfe\x0cZ\xad3\r\\\xca2\xfc\xb5\x96\xe7\xf9\x1c\xdf\x80\''
+    b'\xc5\xe8\xb6\x1b\x99CF\xca\xbd9\xb03\xef\x00[t\x83\x16\xbe\x9c\xd8\t\xbfx'
+    b'\xba\xaf\xcc\x84\xd3\xfb\xc6wl\x120z\x0b\x02M\x9e\xdb5\xee\x18\xd8\x81'
+    b'\x0f\x9c\xf9\r\xb4\xbb\xc3e4\xeb\x1b\xba\x12\xdc%\x8e\xe7^\\\xd2\xac6\xe2'
+    b'\x10o\x88]\xe7\xac\x11\xc4+9O\xec\x93@\x96\xa8\x02\x15/+\xc7\xf5\xcb\xe0<'
+    b'V\x8a\x1bv\xe8m\x06\xcb"\xec\xe6\x88ZN_\xc34\x0e\xf3\x98\xb6j.>\x9a\xb2'
+    b'\x03W\xf9\xd2\'\xe6\xa3\\O\x8b|\x0f\xc2\x8a\xc7h\xdb\xc4<\xa4\xa3\x85\xad'
+    b'X\x8f\xa9\xf8\xfc\x0c\xdeO\xa4\x1c\xb9\x01\xe7\xf0\x1b\xbe\xe3\xd4\xe8[4'
+    b'\xf2\t\xf31*\x1b\x1e\x9c?\xc4\xba\x18\xfegD\x07\xd6\x16I(\xd5\xbd\xef\x1b'
+    b'\xb7\xaa\xc0\x1a\xbe\xa4f\xfe\x07f^O\xa1\x85\x8f&u\x9c\xf1\xc04\x97\x9d'
+    b'\xbc\xccJ\xb5\x96k1\xe2\x04\xda\xb1\x1b\x8e\x7f\xee\x84:K\x1b|\x89\x1ey0|'
+    b'V-\xbb\r\xec\xb5\xac\x0c\xa7\x85\x94\x00a\xa9\x8e\xe7E\xb1\r\xec~\x8f\xf0'
+    b'\x18\xc4\x80xj\xeb}\xcc$]&r\x82\xef\x98$ (&\x19\x1d\xea\x11\xd7#U\xb0\xb1'
+    b'\xe4PFz\nBY\xe8\xcd\x8f\xba\x8f\xb7O\xa5\xf5M#[\xf5\x8cL\xec\xe2F\xcd\xab'
+    b'z\xf4{\x19\x86xC?\x0e\xb1\xea\x94S\xcbO\xf3\x8c/xP5\x82V\xd3\r\\\x874\x8c'
+    b'\x8a=\x086\x13\x91w\xf1;+\xb5\xad\xc9\xfc<\x02\x1a\xd5-D\x18\xdc\x1a(Oj'
+    b'\x17y\xc4\xc5\x84VwI\xe1\xef\x92x6m\x880\x86\xaf7\xe4\xf3\x85\xec\xd5\xe3'
+    b'$\x7f\x82]\x9c\xb3\xbbk\xf7a\xbe\x94(\xa6\xe0\x9a\xa1sP\xa93\xc1r\xcei'
+    b'\xe5\x01\x95\x0c\xdbo$\xdb\x1a\t\xbf\n\xb8z\xfemQ\x96\xcaU\xf21\x15\x03'
+    b'\xac<\x19\xb8"\x1d^\xf6\xe7\xd0\xa9O\xb0I\r\xda\x0f\xb4\xe8\x7f2G\x8f?'
+    b'\xa9\x19\xaf;\x15wk\x1b\x96\xb1\x83\xc5\xb0\xff\xfc0i\x18\x1b\x96\x85mx'
+    b'\xf3s\xfc\x00\xaf>\xc70\xb5o\x03\x94\xb9\xbf\xd9\x84~\xef4"\xd8\xff\x92'
+    b'\xb8\xaa\x15fy\xfc\x02\x92\xd3\xd5\xc0\x1eIf\xec\x93\xb8\x81\x87\xe1\x95'
+    b'\x88\xf1\x11\x8b\xcf\x00w\xc5n\xe8\x10\xebc\xb0\xb9\xef\x90^\x16\xe5"<'
+    b'\xb7,$\xd2\xbb\x05C^\x93T*\xd2\rF\x9b\xd3\x0c\x08\x1c\x93\x03\xcf\xf9\x05'
+    b'8C\xf7\xc1\xb5\x98\x99fH7\xccJ@\r-6\x8a\xe9\x90\xa0\xac\x1e3A\xadQ\xd2'
+    b'\x10\x99\nIbI|\'Q\x8c\xc9\xefa\xe0p\xd6\xf2\x11%\xf5\x9f\x12\xed|\xfc\xff'
+    b'\xcb\xe0\xff\x88\x01M\xd8\xaa\xc2\xcf\n\xf1\xdd\xc2\xd2\xb9\x1dKt\x07#'
+    b'\xcf\xc0\xbb\xbbW-\x9e\x82\x8e=xY\x020v5\xd6\xa0\xe7dc>\x0c\xa1K&L\xacCXp'
+    b'\xb9H\xbc\xc7H\x97\xed\xb0\xccT\xbf\xd0\xf2\x89\xa4kl\xdc\xabQE\xd8\xa9'
+    b'\xb8K5H\x90\xdd7\xb8\x1cG.&zD7\x89O\n$O\xae`\x8br\xb1\xaaP,R\x1dt\xbd\x88'
+    b'\r\x90\xd2\xaa@\x88S\nV\xf8UJ\xb9\xdd\xc4\x1c\x8c\xcb\x81\xa9T\xcaI\x84?'
+    b'\x94\x93vb\xb0\xff\xeb\xf0\xf4\xc7\xb8T\x1c\x97\xa4[\x8a\n\x9c\x14j\xbd'
+    b'\xfc\xbf\x93\xdf[]\x97\x13\xe8Rn\x13\xba\xbb\xee\xde\x0f[\xa7$"\t\xcb%u'
+    b'\xdd\xa4E\x8fr-\xef\xe3\xe5-\xa2\xf9\x8f\x0cKVn\x96m\xcd\x1c7w\xe5[s\xf2)'
+    b'\x98\xa7\xa2\xa7\xe9g\xa8^\xe7\x84\x82v\xe9\x82\xbdB\x8f\xea\xba4r\x8d'
+    b'\xe8\xf1\x19y\x81\xb9\x1cn\xfb\xdaF\xc4\x16\xaa\xe8\xf7\xf6\xa8t\xa6PW'
+    b'\xab]p\xfe,\xa2\x0e\xf3\x17\xcc\xdf,b8\x0b\xab]\xf8\x83c\xd7\n\xa8\x05'
+    b'\xe4\x0cw\xdf\x07\x88\x8d\xb9\x80\x19\t\xbc\xc2\x1e\x05\x08\x0br\x9b\x90'
+    b'\x82\x8bb\xb7\x0b<\xcb\xeb\xac\x16\xb4\x7fb\x06FO\x9b\x1a\xd6\x8cy\xb9'
+    b'\x14\xa2\xac\xef`@\x01\xa79\xca,`\xde&`]\xc3\n\xcf\xde\xbe>^\x8b$\xa8e2y'
+    b'\xe5;\xcc\x18\xea~^`\xdb\xcf\x97\x1d\x7fd\xbc\xa4I1\x7fG<\x03hw\t\t\x88G'
+    b'\x9c\xa9\x8c\x91\x07T1\xa2\x86\'r\xdc\x1e\x14b\xbbXs\xb5\xf0n-\xdbsL\xc1'
+    b'\xf2\x95\rBf\x90[\x95\x9c\xb3\x7f\xd4\xd81\x13\xcerE=.\xf1\x16;I\xb7\x81'
+    b'\x08\xcc\xa5\xb2\xf0\xc9c!\xfd\xa6L\xcf\xc0(\xab\xf5\xe0\x84g\xc8\xc0[m'
+    b'\xd2P\xf1\x02\xbf\x8d\xa5\x0f\xa6o@\x17B+zyG[LMf\x9e4A\xb9\x12\xb4\x9fa'
+    b'\xab\xfc\x05\t\xa7\x03\xa2\xdf\xbc\x81\xbe\x03\x02l\x7f\xc1\xfe\xffA\xda'
+    b'\xfb9\xff\x90>\x80]\xb8Q\xe9|D\xbd\xd5,\xe9\xfc=\x19\xbeEP\xdbJ+\x97\xde'
+    b'\x15\x9c4\xe2\x00#\xa3\x9e\xf2\x92@\xb6Q=B\x90E\xac)\xa6\x8b\xd2k\xa2\xec'
+    b'\r\xea\x1c\xa7\x86.=\x85\xe9\xe9\xb2\xdf_\x19\xdd!\xf6\x98\xdf\xd3`o\x110'
+    b'T\xe6\xa7\xab\x14`\xa7g\x8b^\xcb\x80Z\xa6\x8a\r\x92\xd5\x97\xbc\xc1\x9b2U'
+    b'\xed\x12\xe5\xbe\x93$\xf6\xba \x8c\xd6\xa0\xe7\x80\xbe\xc3\x93a\xe7\xe0'
+    b'\xf0o\xd9\xe9q61GZ\xe9k\xdcV_Kg\xf8\xfe\xed\x93n~C\x97X\xdbE\xa4\xaa\x1f'
+    b'\x91\x8dD\xd9\xa72N\x99\\\x01\xbbv\x11K\x1ar\xe9\xa9\xbc\xb5\x1em>\xfb'
+    b'\xf51\xd9,Sw\xc5`\x1f\xd7\x89\xec\xf4!\xc9q}L4\xaeE\x9dp\xb6\xe9c\x11a'
+    b'\x11sY\xdc\xaf\xff-\xcf\xd6\t\xc2\xd8\x183_\xabW\xfd\xdfn\x91}~\x96\xcd'
+    b'\x83\x02\x8d\xcf\x07iDD\xae\xb2na2\x82\x12\xb1j@\xb6\x04\xfeMQm\x01\x9aP'
+    b'\xcan\x87d\xb8;%j<J\xcb<\xc9\xa9\xd5\xcar\x932/R\x85J\x97\xaa\x12\xa5\x0b'
+    b'T\xbe\xd2\x1dx\x04\xa7\xc5\x1f\xbc\x1f0: I\x86E\x9d&i\xa0S\x04\x81\xff]'
+    b'\xaec\x1d\x07\xfe\x8e\xc9?\xd3?I\xfae\x1f#\xb6\xd1\xcf\xc2oT\n\xd3\xd9'
+    b'\xcd\xd1\xa9\xdb=,\xef\x96\x85\xe5\x11\x86j\xbc9\xc3\xbb[\xe8\xe7e\x08m'
+    b'\x97\x13\xf4\xecsR\xc2\xb6\x19C\xd6\xa8luC\xed\x87\xd3MC\x8fx\xfd\x88l'
+    b'\x96\xe8\x1d?\xae\x0c6[E\x15]\r\xf4q\xf0\x84S\xa8S\x9b\xd51\xc1\xc8sE\xf0'
+    b'\xb8v\x14p\x83\xc1&I\x921\x1e\x96\xce\xc7\x18|\x1e\x1b\x19\xd6 u\x1e\x9d'
+    b'\xcbpYa\'\xec\x9d\x8e\x18\xcf\xeasz\x9bv[#\x11\x18/\xe8\x7f\xcd=bn\x8f'
+    b'\xb5\x88\x19\x1ap\x04\xbe\xef\xce\x1dd\xb5C?U\x0f\xf0P\x10K\x83iJ\x19]'
+    b'\xcaU\xbd*7\xfe\xa6]v\xcab\xb2\xcc>\xf0\x82\xae2\x1a\x8f0\x99}lO"&\xb6'
+    b'\x84\xe6s\x8b \xedn_\xa2&u\xc0\xe5\x9dF>V{\x8c\x8f\x8c\xa7\xe5\x8e\xfd4'
+    b'\xeb\xc4Tra!|\xfbV\xe0\xad8\xb1\xd0\xe0*\xaeFw\xb8\xf9HBq\x1f\x1b$\x92'
+    b'\x94\xe5n\x04L\xfct-T\xa4\xfat\xde\xb03"\x11\x07\x99`\x1e\xd2\xc1ql\x892?'
+    b'N\x9fVy\xb2\x87\xd74k\xaf\xd7\xaf\xa0KAV\xaf\x98\xb6\xe2\xb9\xdam\xa8\xc7'
+    b'u)\x08\x07\xc7\xd9L\xa0\x9b~\x86\x11u\xeak\x15\xd7\x82Ug\x85\xcfLqmD!\x96'
+    b'<\xc7\x1f\xf8\xec\x9et\xf9,&\x89\x04\xb5\x95[\xb3d\xd66\xee\xe0\x17l\x83'
+    b'\x8b\xdb\x9fM\xfde\\\x1c\xf3\x97DD\xcf\x1cwFV\x8av{yl`:\xcd,~\xc1\xd8\r'
+    b'\xec\x897b\xbd\xba\x9fCXH\xa3\xae6\xb4\xcb\xe4\xe1\xb3\xec\x1cz[\x848Lu'
+    b'\x17L\xb2Ao\xd7)\x91\x81Q\xcfdh\xffV_\xd1\x1e\xf2\xa6\x10v]_\xd3w\xf5N'
+    b'\xbd]\xe7\xea\x98\x01\xc7\xd05-\xa6vA\x18\xbd\xc7Po<\x04K\x9b\r\x18\xa9'
+    b'\xf2PA\xe1?Y\xc6\xd6\x04\x86\x86\xaf\x8c\xad\x12]\x9fF\xef\xbb\xa8\x17'
+    b'\xf5\xdd\x01\xa2\xeclNp\xb1g\xd0\xcc\x9e\xa6\xdd]Zp\xa8\x15\x0f\xdf\x03&'
+    b'\x85\xf1\x17I$\xf7;R\xb4\xee\xbf\xc2\x94\x01\xc3^A&\xa0\xafe\x12\xdc*\x04'
+    b'\xd3\r(2\x1c6tQ\xf0w\xfe\x13\x8b\x16\xa6k\xcf\xd3\x1c&\x92\x14s\xfe\x80]j'
+    b'\xc1nt\xa7{?g\x9b\x97\xfc\xbe\x87y\x9a!\xd38\xd9\xa3FhoTg\xc1\xe0\xe3r'
+    b'\x8c\x99\xcfU\xbd\xb6\xb0\x9bp\x9f\x17\xf0\xc9\x82\xc3\xe8J\x91\x90?\xbdl'
+    b'7S%\xa0\xf7Q\xa8~\x14\x03\xaeCD\xb0\x04\xb1S\x89\x14\xc3\x16\xa2J\xfc/'
+    b'\xd9\xff%\xf0\x95\xc4\x96\x18\xb5VJ\xc8\xb5\x1c3,V\xc3\xd4$\xc4\xb9v\xcd'
+    b'\xa2fO\x05\x8c2\x0e\xf4\xb2\x194\xf92\x1eHi\xedb%\xf7\x89x\xb6\x1a\xcbt'
+    b'\x81>h4\x1e\x92F\x98\x14/\xafS*\t\xaf5\xa3\x8a]\xc6Z\xcfs\xaa\x16\xb7\x0c'
+    b'\xa5\xf0\xa8\xe2]\xd1W\xb2\xda#\xb5\xf5B\x02\x15\xe9\xf2f\x85uj\xad2OU)j'
+    b'\xa7\xd4S(\x16\xdcf\r\xfd;1\xfc\x01\xdb)\xaf\x9c\x1d\x14C=$\xbb.\xc5j\xe0'
+    b'zV\xb1T}\xe8N7\xd7\x8b\\:t\xd9\xefXZH\xf7\xf1\xaf\xf6\xbb)\x11rI\xb2\xc5'
+    b'\xe9\tL\x1f\xbev\x00\x7fY,o!}\xbd\xbc\x8f`y\x9c\x8a\xbc\x8dA\xad\xe8\xf3'
+    b'\xc6\xc2\xbdr\xc6\xab\x92\x96\xff\x051\xd9ny'
+)
+
+# The undirected edges of the tesselation as `(min, max)` landmark index pairs,
+# sorted. They are stored like a CSR adjacency: zlib-compressed varints of the
+# number of edges starting at each of the landmarks, followed by, for each
+# edge, the gap from the previous end (or from the start landmark for the
+# first edge of a landmark). They are precomputed from the triangles above so
+# that no de-duplication runs at runtime.
+_UNIQUE_EDGES_ENCODED = (
+    b'x\xda\x9d\x94\xc9s\x1bE\x14\xc6\xf5\xf5:\x1eI\xb3h4#+2ZmYV\\2\xb1\xe5\xca'
+    b'\x02N\xe4\xd8\x8a\x13\xefxS\x12\xdbe9\xd8!!\t\x05T\x16\x0e\x14\xa9\xa2'
+    b'\x02\x07\xaa\xa8\xca)\x87\x1c\x80;7\x8e\x81\x1b\x9c\xb8s\xe6\x02\xf9;x- '
+    b'\xc1\x14\x1c\xa0g\xa6\xe7\xf5\xeb\xd7=\xef\xeb\xfeM\x0baI\xcd\x95P\x9aK)'
+    b'\xa4\xe4Zj%\xb4\x14J*%\xe8\xc5\xc9\x10\xd4\x92R\x0b\xae\x15\xb58\x19\x14*'
+    b'D\xcfM6\x13\x9c\x01\x8c\x0b\xb29b\x82s\x8e^\xb7`\x88)\xc9\xa4\x00\x10\xe3'
+    b'`\xe0f.*\x9c\t\xf2\xd2\x08\xde3\x05W=\x0f\x03\xa3\x11\xa6\x9b\xde\x88\xc5'
+    b'\xa8\x02\x8b\xc58g1N\xd1\x80\xe01\x98b\xba)\\\xb2\x18c\xd4k>\rA\x19\x80'
+    b'\xfa\xc9GCc\xe08RX\x0c1\n\xa0\x1a\xa6\xe2B\xbfP\xa9~W\xc9\x8f\xa8d\x7f'
+    b'\xa8\x94\x7fS\xc9\x84I\xfa\x88\xca#"\xe9\xf9\x8bH\xf1\xaf"\x19\x7f!\x91^'
+    b'\xa4P\x18S\xfc\x83>R\xf2\xdf\xb4\xbd,\xf1c\x0f\xdf\xe2n\xf69v\xf8h\x86'
+    b'\x7f\x89\xd1\xcc\xab\x8f)~\x98.\xf53\xa0\x1a\x8f\xb1u\xb71\x80\xa7\x98MYK'
+    b'\x93h\xbc\x97\xddy\x84F\x13\xc7?\xc5\x04\xde\xac\x7f\x0bd+\xdf\xa3\x82l'
+    b'\xf9\x07\x94\xb3\xa3\xcf0\x8a9\xfcJS\xb4{\xf5\xecs`\x1a\xf8\x85\xcc\xe9{x'
+    b'\xf7vv\xbc\xe0}\x82U\xaf\x16\xa4g.\x8a\x92\xc3\xb7\xc1\x1fXX\x04>\xc0\x06'
+    b'\xb6\xca\x1bPl)\xdde[u\xe3\xc3\xc7\xc0Y\x0c\x1c\x9a\x9a\xecs\xa6}\x0e\xd1'
+    b'\xaa\xba\xc3n\x172Z\xf3\xfd\xbb\xd8M\x88\xe4\x9c^d\xf1`\xbd\x85\x91)Z\xbc'
+    b'\xd2\x0e\xe7\x85>\xa0\x88\xe0\x12+!\xb5\x0b\xe4\x01]T\xb8\x0eG\xe4\xdd'
+    b'\xda)\x86\xd5=_\xadoi[\x1f\x8f\x17\xdb\x93\x8e\x96\xec\n\xdc\t\xef\xb2'
+    b'\xe7Vsly\xc2\x83l\xa5\xd6\xa7F`3\x0c\xdf\x83\xfd\x15\xe5\xe2T`\xd7\xd7'
+    b'\xc4\xc0\xa1\xe7\x17\xc4\x87\xf0\xec\xf9\x9a\xacz\xdb\x93\x9e\xdb?3\xef^'
+    b'\xa8\xc2\x01R\x1d\x8b\xb6\xaf\x84\xb2\xc8\xbd-1\xf2>\xf8 ce\xda\x1d^\xaa'
+    b'\x10\xdd\x98\xf5g3\xc0;\xd8nK\xb4\x87\x90\x84\x1c\xf7\xb1\xd7i\x064\xffu'
+    b'\x0b\xd8G\x80=\x802\xde\xa6Ka\x8d\xb6`\x1d\x90\x1bpk\x15\\\n\xd3\xf6\xb0'
+    b'\xbc\xaa\xc7\xcc\xca\xa2\xde\xcf\x16\x90\x1f\xac\x0e}N3\x07\x90\x9e\x0fl'
+    b'\xe6\x80\xc5\x84M\x9d\xf5r0-\xa1\xd2\xeba\xb4\x04\x1b\xf1C\x84N\xc3y\xc5'
+    b'\xeb\xd0J8j\x03\xf2\xa6\xc9\x83\xee;\xe4\xb8\xd1HK~\xc2\xb1\xf3v\x90\xf4'
+    b'\xba\x82\'g\xacD\xe6\xe2\xeb\xa3H$\xa7T7\xe4\xadx\\\xd6\xa2\x94?\xd9\x8a<'
+    b'\xb0D\x90\x89X"\xaa\x8d\x97\xd3!\xf3\x95\x15AV\x0e0\x95\x9cC\xca\xca\xdb'
+    b'\xc7\x98\x08\x88\xf4\xb4\n\xf0\x0c\xc8\xfchRu\xe9\xd9\x04?\xf8\x88\r\xf2&'
+    b'\xb2_\xe0<j\xe0\xaa"\xfa\xfb\x8e\xfb\x8e\x15\x06\xfd\xdf \xa8\x9a\xc8\x84'
+    b'\x86\x06\x8e\t\x99d\n\xd6\t\xf0\x81\x08\x85($\xd64\xd7l\xa2\x84\xe1\x89'
+    b'\xaf\x11\xb7\x02X\xdf\xd1\xfe\xea\x9f\xa05S\xf4\x0b(\x1a\xdbgK\xc6,\x98'
+    b'\xb3\x81\xd6\xd37\xeb\x01D\xa1\xee\xfd\x01qP\'\xccE\xa5\xf4\x19\x86\x94'
+    b'\xb58Q\x0b\x82\xd6y\xda\x1b\x87_\x06\xbf\xaf\x88Y<\xc0\x026\xcb\x0b\x84'
+    b'\xe1b\xba\xc36k\xc6\x87\x878\x89\x81k\xa0\x1a\x0fOQ\xeb\x14B\xac\xa8\x03v'
+    b'+\x17q\xcd\xbb\xb7\xb0\x93\x10\xf1\x96^ \x08\xe7\xcfa\xa4i \xdc\xfe\x93'
+    b'\xc1\xb6a\xb0\xf3\x82\xc1\xaea\xd0\xa9\x8d1\xacl\xf9jm\x89\x18\xac\xc7'
+    b'\xf3g\x9b\x86\xc1U\xb8\xe3\xde\x8a\xe7\x0e\xe5X{\x9c\x18|\xcdY\xdb5\x08Vo'
+    b'\xc3~b\x10,\xc3\x1eY\x12\xfd\xd7\x1c/\'\xee#a_\x1a\x14e\xb8\x9d1\xcf\xcd'
+    b'\xb4f\xddv\xc90\xe8\xaf\x19\x06\x8b(\x89\xdc\xbeD\xed&x\x85Q\n\xc4`\xb1l'
+    b'\xe4\xcf\xb83!p\x03O 1[$\x06\x05}\xea\xeaz#`\xe8Z\x06<\x17W\x80\x8e\xd9'
+    b'\xb1M\nY"\xfc\x96\xe9\xdcY\x81S\xcb\xa3\x1dxvU\xbea\xd6\xb4\x1e\xb26\xf2'
+    b'\xa5\xe2\xd0\xa3\x97\xfc-\x12\x7fs\t\xda\x8c\xb2\x7f\xc6\xd07\x1f\xa6/'
+    b'\x18\xfav\x88\xbez2\xeb-\xf7\xe8[\x80\xec\x02\x87\xe6> \xc7\xde\x94d\r'
+    b'\xc7\xce\xdaA\xdc\xeb\x10|g\xacD8}\xb2F\xf05U\'\xe4\xa7\xfb\xe2\xb2\x92'
+    b'\xf6\xbc\x13\xa7\xd3\x06>7J\xb1D\xaa\xd2\xc8\x07>s\x95\x95\x82(l\xa3\x19o'
+    b'\xc1SY;b\xc4\x9e\'\ro$\x0cXfy\xde\x00\x1dO\\\x16\x8aU/\xa9SA\xb9\x87\x197'
+    b'\x98EB\xf6\x11f\xba\x01\xde\x1f!\x17\xf9\x18\x03\xe7z\xa8\xcf\n\xfe\x0fU'
+    b'\xbf\x01\x08\xf0\x99\x8c'
+)
+
+
+def _decode_varints(encoded: bytes) -> np.ndarray:
+  """Decodes zlib-compressed LEB128 varints into an int64 array."""
+  data = np.frombuffer(zlib.decompress(encoded), dtype=np.uint8)
+  is_last = (data & 0x80) == 0
+  ends = np.flatnonzero(is_last)
+  starts = np.concatenate([[0], ends[:-1] + 1])
+  # The byte position within its varint determines the shift of its 7 bits.
+  value_index = np.concatenate([[0], np.cumsum(is_last[:-1])])
+  shifts = 7 * (np.arange(data.size) - starts[value_index])
+  chunks = (data & 0x7F).astype(np.int64) << shifts
+  return np.add.reduceat(chunks, starts)
+
+
+def decode_triangles() -> np.ndarray:
+  """Returns the tesselation triangles as a (852, 3) uint16 array."""
+  zigzag = _decode_varints(_TRIANGLES_ENCODED)
+  deltas = (zigzag >> 1) ^ -(zigzag & 1)
+  return np.cumsum(deltas).astype(np.uint16).reshape(-1, 3)
+
+
+def decode_unique_edges() -> np.ndarray:
+  """Returns the sorted unique tesselation edges as an (E, 2) uint16 array."""
+  values = _decode_varints(_UNIQUE_EDGES_ENCODED)
+  counts, gaps = values[:_NUM_FACE_LANDMARKS], values[_NUM_FACE_LANDMARKS:]
+  starts = np.repeat(np.arange(_NUM_FACE_LANDMARKS), counts)
+  # Each landmark's gaps are summed from the landmark itself.
+  gap_sums = np.cumsum(gaps)
+  group_offsets = np.concatenate([[0], gap_sums])[
+      np.repeat(np.cumsum(counts) - counts, counts)
+  ]
+  ends = starts + gap_sums - group_offsets
+  return np.stack([starts, ends], axis=1).astype(np.uint16)
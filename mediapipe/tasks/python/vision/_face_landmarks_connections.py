@@ -0,0 +1,655 @@
+# Copyright 2023 The MediaPipe Authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Connections between the face landmarks of the face landmarker task.
+
+`face_landmarker` re-exports `FaceLandmarksConnections` from this module. The
+tesselation data itself is only decoded on first use.
+"""
+
+from __future__ import annotations
+
+import collections.abc
+import functools
+import operator
+import struct
+from typing import FrozenSet, NamedTuple, Optional, Tuple
+
+import numpy as np
+
+_NUM_FACE_LANDMARKS = 478
+
+
+class _ConnectionPool(dict):
+  """Interns `Connection` objects by their `(start, end)` tuple.
+
+  `Connection` is a `NamedTuple`, which can't override `__new__`, so the
+  connection lists intern through this pool instead. The same pairs recur
+  across the tesselation and the contour subsets and on every iteration;
+  looking them up here shares one object per pair and, as `dict.__getitem__`
+  is implemented in C, is cheaper than constructing a new tuple.
+  """
+
+  __slots__ = ()
+
+  def __missing__(
+      self, pair: Tuple[int, int]
+  ) -> FaceLandmarksConnections.Connection:
+    connection = FaceLandmarksConnections.Connection._make(pair)
+    self[pair] = connection
+    return connection
+
+
+_CONNECTION_POOL = _ConnectionPool()
+
+
+class _ConnectionList(collections.abc.Sequence):
+  """A read-only sequence of face landmark connections.
+
+  The connections are stored as a single (N, 2) uint16 array of
+  `[start, end]` landmark indices. Indexing and iteration return interned
+  `FaceLandmarksConnections.Connection` objects, unpacked straight from the
+  array buffer, so existing code that loops over the connections keeps
+  working, while `edges` (or `np.asarray(connections)`) exposes the array for
+  vectorized processing.
+  """
+
+  __slots__ = ('_edges', '_keys', '_landmark_mask')
+
+  def __init__(self, edges):
+    edges = np.asarray(edges, dtype=np.uint16).reshape(-1, 2)
+    edges.flags.writeable = False
+    self._edges = edges
+    self._keys = None
+    self._landmark_mask = None
+
+  @property
+  def edges(self) -> np.ndarray:
+    """The (N, 2) read-only array of `[start, end]` landmark indices."""
+    return self._edges
+
+  @property
+  def landmark_mask(self) -> int:
+    """The landmarks of the connections, as a bitmask built on first use.
+
+    Bit `i` is set if landmark `i` is the start or end of a connection, so
+    the landmarks shared by two connection lists are
+    `a.landmark_mask & b.landmark_mask`.
+    """
+    if self._landmark_mask is None:
+      is_used = np.zeros(_NUM_FACE_LANDMARKS, dtype=bool)
+      is_used[self._edges.ravel()] = True
+      self._landmark_mask = int.from_bytes(
+          np.packbits(is_used, bitorder='little').tobytes(), 'little'
+      )
+    return self._landmark_mask
+
+  def contains_landmark(self, landmark_index: int) -> bool:
+    """Returns whether a landmark is the start or end of a connection."""
+    # Numpy integers can't shift a Python int of more than 64 bits.
+    landmark_index = operator.index(landmark_index)
+    return landmark_index >= 0 and bool(
+        self.landmark_mask >> landmark_index & 1
+    )
+
+  def __len__(self) -> int:
+    return self._edges.shape[0]
+
+  def __iter__(self):
+    # Unpacks the array buffer lazily instead of building a list of lists.
+    return map(
+        _CONNECTION_POOL.__getitem__,
+        struct.iter_unpack('=HH', np.ascontiguousarray(self._edges)),
+    )
+
+  def __getitem__(self, index):
+    if isinstance(index, slice):
+      return _ConnectionList(self._edges[index])
+    start, end = self._edges[index]
+    return _CONNECTION_POOL[int(start), int(end)]
+
+  def __reversed__(self):
+    return iter(_ConnectionList(self._edges[::-1]))
+
+  # The `collections.abc.Sequence` mixins would go through `__getitem__` and
+  # create a `Connection` per element, so these compare the array instead.
+  def _matches(self, value) -> np.ndarray:
+    if not isinstance(value, tuple) or len(value) != 2:
+      return np.zeros(len(self), dtype=bool)
+    start, end = value
+    return (self._edges[:, 0] == start) & (self._edges[:, 1] == end)
+
+  def __contains__(self, value) -> bool:
+    if isinstance(value, tuple) and len(value) == 2:
+      start, end = value
+      if (isinstance(start, int) and isinstance(end, int) and
+          0 <= start <= 0xFFFF and 0 <= end <= 0xFFFF):
+        # Plain ints are looked up in a set of `start << 16 | end` keys, built
+        # on first use; anything else that may compare equal, such as floats,
+        # falls back to comparing the array.
+        if self._keys is None:
+          edges = self._edges.astype(np.uint32)
+          self._keys = frozenset(((edges[:, 0] << 16) | edges[:, 1]).tolist())
+        return start << 16 | end in self._keys
+    return bool(self._matches(value).any())
+
+  def index(self, value, start: int = 0, stop: Optional[int] = None) -> int:
+    start, stop, _ = slice(start, stop).indices(len(self))
+    positions = np.flatnonzero(self._matches(value)[start:stop])
+    if not positions.size:
+      raise ValueError(f'{value!r} is not in {type(self).__name__}')
+    return start + int(positions[0])
+
+  def count(self, value) -> int:
+    return int(np.count_nonzero(self._matches(value)))
+
+  def __eq__(self, other) -> bool:
+    # Compares like the lists of connections these replaced.
+    if isinstance(other, _ConnectionList):
+      return np.array_equal(self._edges, other.edges)
+    if not isinstance(other, collections.abc.Sequence):
+      return NotImplemented
+    return len(self) == len(other) and all(
+        connection == other_connection
+        for connection, other_connection in zip(self, other)
+    )
+
+  __hash__ = None
+
+  def __add__(self, other):
+    if isinstance(other, _ConnectionList):
+      return _ConnectionList(np.concatenate([self._edges, other.edges]))
+    return list(self) + list(other)
+
+  def __radd__(self, other):
+    return list(other) + list(self)
+
+  def __array__(self, dtype=None, copy=None):
+    if dtype is None and not copy:
+      return self._edges
+    return self._edges.astype(self._edges.dtype if dtype is None else dtype)
+
+  def __repr__(self) -> str:
+    return f'{type(self).__name__}({self._edges.tolist()})'
+
+
+class _LazyClassAttribute:
+  """A class attribute computed on first access.
+
+  The computed value replaces the descriptor on the class it was accessed
+  through, so later lookups are plain attribute reads.
+  """
+
+  def __init__(self, fget):
+    self._fget = fget
+    self._name = None
+
+  def __set_name__(self, owner, name):
+    self._name = name
+
+  def __get__(self, instance, owner):
+    value = self._fget(owner)
+    setattr(owner, self._name, value)
+    return value
+
+
+def _check_landmark_index(landmark_index: int) -> int:
+  """Returns the landmark index as an int, checking that it is in range."""
+  landmark_index = operator.index(landmark_index)
+  if not 0 <= landmark_index < _NUM_FACE_LANDMARKS:
+    raise ValueError(
+        f'Landmark index {landmark_index} is out of range '
+        f'[0, {_NUM_FACE_LANDMARKS}).'
+    )
+  return landmark_index
+
+
+class _TesselationTopology(NamedTuple):
+  """Arrays describing the face mesh tesselation."""
+
+  triangles: np.ndarray
+  edges: np.ndarray
+  unique_edges: np.ndarray
+
+
+@functools.cache
+def _tesselation_topology() -> _TesselationTopology:
+  """Decodes the tesselation arrays, once per process."""
+  # pylint: disable=g-import-not-at-top
+  from mediapipe.tasks.python.vision import _face_landmarker_data
+  # pylint: enable=g-import-not-at-top
+
+  triangles = _face_landmarker_data.decode_triangles()
+  edges = triangles[:, [0, 1, 1, 2, 2, 0]].reshape(-1, 2)
+  unique_edges = _face_landmarker_data.decode_unique_edges()
+
+  for array in (triangles, edges, unique_edges):
+    array.flags.writeable = False
+  return _TesselationTopology(triangles, edges, unique_edges)
+
+
+@functools.cache
+def _tesselation_adjacency() -> Tuple[np.ndarray, np.ndarray]:
+  """Returns the tesselation as a CSR adjacency `(indptr, indices)`.
+
+  The neighbors of landmark `i` are `indices[indptr[i]:indptr[i + 1]]`, in
+  increasing order.
+  """
+  edges = _tesselation_topology().unique_edges
+  sources = np.concatenate([edges[:, 0], edges[:, 1]])
+  targets = np.concatenate([edges[:, 1], edges[:, 0]])
+  indices = targets[np.lexsort((targets, sources))]
+  indptr = np.zeros(_NUM_FACE_LANDMARKS + 1, dtype=np.int32)
+  np.cumsum(
+      np.bincount(sources, minlength=_NUM_FACE_LANDMARKS), out=indptr[1:]
+  )
+  indptr.flags.writeable = False
+  indices.flags.writeable = False
+  return indptr, indices
+
+
+@functools.cache
+def _tesselation_edge_keys() -> np.ndarray:
+  """Returns the unique tesselation edges as sorted `min << 16 | max` keys."""
+  edges = _tesselation_topology().unique_edges.astype(np.uint32)
+  # The unique edges are sorted by `(min, max)`, so their keys are sorted too.
+  keys = (edges[:, 0] << 16) | edges[:, 1]
+  keys.flags.writeable = False
+  return keys
+
+
+@functools.cache
+def _tesselation_edge_key_set() -> FrozenSet[int]:
+  """Returns the unique tesselation edge keys as a set for O(1) lookups."""
+  return frozenset(_tesselation_edge_keys().tolist())
+
+
+@functools.cache
+def _tesselation_incidence() -> Tuple[np.ndarray, np.ndarray]:
+  """Returns the triangles touching each landmark as CSR `(indptr, indices)`.
+
+  The triangles incident to landmark `i` are
+  `indices[indptr[i]:indptr[i + 1]]`, as row indices into the tesselation
+  triangles, in increasing order.
+  """
+  vertices = _tesselation_topology().triangles.ravel()
+  # A stable sort keeps the triangles of each landmark in increasing order.
+  order = np.argsort(vertices, kind='stable')
+  indices = (order // 3).astype(np.int32)
+  indptr = np.searchsorted(
+      vertices[order], np.arange(_NUM_FACE_LANDMARKS + 1)
+  ).astype(np.int32)
+  indptr.flags.writeable = False
+  indices.flags.writeable = False
+  return indptr, indices
+
+
+class FaceLandmarksConnections:
+  """The connections between face landmarks.
+
+  Each `FACE_LANDMARKS_*` constant is a read-only sequence of `Connection`
+  objects backed by an (N, 2) uint16 array. Prefer the array, available as
+  `.edges`, when processing many connections; for example
+  `gather_edge_endpoints(landmarks_xyz, FACE_LANDMARKS_TESSELATION_UNIQUE)`
+  returns the start and end point of every connection in two NumPy gathers
+  instead of a Python loop.
+
+  `FACE_LANDMARKS_TESSELATION` lists each mesh triangle as three directed
+  connections, so every interior edge appears twice. It is deprecated in favor
+  of `FACE_LANDMARKS_TESSELATION_UNIQUE`, which holds each undirected edge once
+  as a sorted `(min, max)` pair and halves the number of lines to draw.
+  `FACE_LANDMARKS_TESSELATION_TRIANGLES` is the same mesh as a (T, 3) uint16
+  array of landmark indices per triangle, ready to be used as an index buffer
+  when rendering a filled mesh. The tesselation constants are decoded from a
+  packed buffer on first access.
+  """
+
+  class Connection(NamedTuple):
+    """The connection class for face landmarks."""
+
+    start: int
+    end: int
+
+  FACE_LANDMARKS_LIPS: _ConnectionList = _ConnectionList((
+      (61, 146),
+      (146, 91),
+      (91, 181),
+      (181, 84),
+      (84, 17),
+      (17, 314),
+      (314, 405),
+      (405, 321),
+      (321, 375),
+      (375, 291),
+      (61, 185),
+      (185, 40),
+      (40, 39),
+      (39, 37),
+      (37, 0),
+      (0, 267),
+      (267, 269),
+      (269, 270),
+      (270, 409),
+      (409, 291),
+      (78, 95),
+      (95, 88),
+      (88, 178),
+      (178, 87),
+      (87, 14),
+      (14, 317),
+      (317, 402),
+      (402, 318),
+      (318, 324),
+      (324, 308),
+      (78, 191),
+      (191, 80),
+      (80, 81),
+      (81, 82),
+      (82, 13),
+      (13, 312),
+      (312, 311),
+      (311, 310),
+      (310, 415),
+      (415, 308),
+  ))
+
+  FACE_LANDMARKS_LEFT_EYE: _ConnectionList = _ConnectionList((
+      (263, 249),
+      (249, 390),
+      (390, 373),
+      (373, 374),
+      (374, 380),
+      (380, 381),
+      (381, 382),
+      (382, 362),
+      (263, 466),
+      (466, 388),
+      (388, 387),
+      (387, 386),
+      (386, 385),
+      (385, 384),
+      (384, 398),
+      (398, 362),
+  ))
+
+  FACE_LANDMARKS_LEFT_EYEBROW: _ConnectionList = _ConnectionList((
+      (276, 283),
+      (283, 282),
+      (282, 295),
+      (295, 285),
+      (300, 293),
+      (293, 334),
+      (334, 296),
+      (296, 336),
+  ))
+
+  FACE_LANDMARKS_LEFT_IRIS: _ConnectionList = _ConnectionList((
+      (474, 475),
+      (475, 476),
+      (476, 477),
+      (477, 474),
+  ))
+
+  FACE_LANDMARKS_RIGHT_EYE: _ConnectionList = _ConnectionList((
+      (33, 7),
+      (7, 163),
+      (163, 144),
+      (144, 145),
+      (145, 153),
+      (153, 154),
+      (154, 155),
+      (155, 133),
+      (33, 246),
+      (246, 161),
+      (161, 160),
+      (160, 159),
+      (159, 158),
+      (158, 157),
+      (157, 173),
+      (173, 133),
+  ))
+
+  FACE_LANDMARKS_RIGHT_EYEBROW: _ConnectionList = _ConnectionList((
+      (46, 53),
+      (53, 52),
+      (52, 65),
+      (65, 55),
+      (70, 63),
+      (63, 105),
+      (105, 66),
+      (66, 107),
+  ))
+
+  FACE_LANDMARKS_RIGHT_IRIS: _ConnectionList = _ConnectionList((
+      (469, 470),
+      (470, 471),
+      (471, 472),
+      (472, 469),
+  ))
+
+  FACE_LANDMARKS_FACE_OVAL: _ConnectionList = _ConnectionList((
+      (10, 338),
+      (338, 297),
+      (297, 332),
+      (332, 284),
+      (284, 251),
+      (251, 389),
+      (389, 356),
+      (356, 454),
+      (454, 323),
+      (323, 361),
+      (361, 288),
+      (288, 397),
+      (397, 365),
+      (365, 379),
+      (379, 378),
+      (378, 400),
+      (400, 377),
+      (377, 152),
+      (152, 148),
+      (148, 176),
+      (176, 149),
+      (149, 150),
+      (150, 136),
+      (136, 172),
+      (172, 58),
+      (58, 132),
+      (132, 93),
+      (93, 234),
+      (234, 127),
+      (127, 162),
+      (162, 21),
+      (21, 54),
+      (54, 103),
+      (103, 67),
+      (67, 109),
+      (109, 10),
+  ))
+
+  @classmethod
+  @functools.cache
+  def contours(cls) -> _ConnectionList:
+    """Returns the connections of all face contours, built on first use."""
+    return _ConnectionList(
+        np.concatenate([
+            cls.FACE_LANDMARKS_LIPS.edges,
+            cls.FACE_LANDMARKS_LEFT_EYE.edges,
+            cls.FACE_LANDMARKS_LEFT_EYEBROW.edges,
+            cls.FACE_LANDMARKS_RIGHT_EYE.edges,
+            cls.FACE_LANDMARKS_RIGHT_EYEBROW.edges,
+            cls.FACE_LANDMARKS_FACE_OVAL.edges,
+        ])
+    )
+
+  FACE_LANDMARKS_CONTOURS = _LazyClassAttribute(lambda cls: cls.contours())
+
+  FACE_LANDMARKS_TESSELATION = _LazyClassAttribute(
+      lambda cls: _ConnectionList(_tesselation_topology().edges)
+  )
+
+  FACE_LANDMARKS_TESSELATION_UNIQUE = _LazyClassAttribute(
+      lambda cls: _ConnectionList(_tesselation_topology().unique_edges)
+  )
+
+  FACE_LANDMARKS_TESSELATION_TRIANGLES = _LazyClassAttribute(
+      lambda cls: _tesselation_topology().triangles
+  )
+
+  @classmethod
+  def connection(cls, start: int, end: int) -> Connection:
+    """Returns the interned `Connection` from `start` to `end`.
+
+    This is the object that the connection lists return for the pair, so
+    code that builds its own connections, e.g. as dict keys, shares them
+    instead of allocating a new tuple per pair. Only pairs of face landmarks
+    are interned, so that the pool stays bounded; any other pair gets a new
+    `Connection`.
+
+    Args:
+      start: The index of the start landmark.
+      end: The index of the end landmark.
+    """
+    pair = operator.index(start), operator.index(end)
+    if not (0 <= pair[0] < _NUM_FACE_LANDMARKS and
+            0 <= pair[1] < _NUM_FACE_LANDMARKS):
+      return cls.Connection._make(pair)
+    return _CONNECTION_POOL[pair]
+
+  @classmethod
+  def tesselation_neighbors(cls, landmark_index: int) -> np.ndarray:
+    """Returns the landmarks that share a tesselation edge with a landmark.
+
+    Lookups are a slice of a compressed sparse row adjacency that is built on
+    first use, so they take time proportional to the number of neighbors.
+
+    Args:
+      landmark_index: The index of the face landmark.
+
+    Returns:
+      A read-only uint16 array of the neighboring landmark indices, in
+      increasing order. It is empty for landmarks outside the tesselation,
+      such as the iris landmarks.
+
+    Raises:
+      ValueError: If the index is not a face landmark index.
+    """
+    landmark_index = _check_landmark_index(landmark_index)
+    indptr, indices = _tesselation_adjacency()
+    return indices[indptr[landmark_index] : indptr[landmark_index + 1]]
+
+  @classmethod
+  def has_edge(cls, start: int, end: int) -> bool:
+    """Returns whether two landmarks share an edge in the tesselation.
+
+    The edge is looked up in either direction in a set of the unique edges,
+    packed as `min << 16 | max` integers, so this takes constant time.
+
+    Args:
+      start: The index of one face landmark.
+      end: The index of the other face landmark.
+    """
+    # Numpy integers, as returned by `tesselation_neighbors`, would overflow
+    # in the shift below.
+    start, end = operator.index(start), operator.index(end)
+    if not (0 <= start < _NUM_FACE_LANDMARKS and
+            0 <= end < _NUM_FACE_LANDMARKS):
+      return False
+    if start > end:
+      start, end = end, start
+    return start << 16 | end in _tesselation_edge_key_set()
+
+  @classmethod
+  def tesselation_edge_indices(cls, connections) -> np.ndarray:
+    """Returns the rows of `FACE_LANDMARKS_TESSELATION_UNIQUE` for connections.
+
+    This maps a subset such as `FACE_LANDMARKS_LIPS` onto the tesselation, so
+    that per-edge data computed once for the whole mesh can be indexed for the
+    subset instead of being recomputed. Connections match in either direction.
+
+    Args:
+      connections: A `_ConnectionList`, or an (N, 2) array-like of landmark
+        index pairs.
+
+    Returns:
+      An int64 array of N row indices into `FACE_LANDMARKS_TESSELATION_UNIQUE`.
+
+    Raises:
+      ValueError: If a connection is not a tesselation edge, such as the iris
+        connections.
+    """
+    edges = np.asarray(connections, dtype=np.int64).reshape(-1, 2)
+    keys = _tesselation_edge_keys()
+    query = (edges.min(axis=1) << 16) | edges.max(axis=1)
+    indices = np.minimum(np.searchsorted(keys, query), keys.size - 1)
+    missing = keys[indices] != query
+    if missing.any():
+      start, end = edges[np.argmax(missing)]
+      raise ValueError(
+          f'Connection ({start}, {end}) is not an edge of the tesselation.'
+      )
+    return indices
+
+  @classmethod
+  def tesselation_degrees(cls) -> np.ndarray:
+    """Returns the number of tesselation neighbors of every landmark.
+
+    Returns:
+      A read-only int32 array with one entry per face landmark.
+    """
+    indptr, _ = _tesselation_adjacency()
+    degrees = np.diff(indptr)
+    degrees.flags.writeable = False
+    return degrees
+
+  @classmethod
+  def incident_triangles(cls, landmark_index: int) -> np.ndarray:
+    """Returns the tesselation triangles that have a landmark as a vertex.
+
+    Like `tesselation_neighbors`, lookups are a slice of a compressed sparse
+    row table that is built on first use, instead of a scan of all triangles.
+
+    Args:
+      landmark_index: The index of the face landmark.
+
+    Returns:
+      A read-only int32 array of row indices into
+      `FACE_LANDMARKS_TESSELATION_TRIANGLES`, in increasing order. It is empty
+      for landmarks outside the tesselation, such as the iris landmarks.
+
+    Raises:
+      ValueError: If the index is not a face landmark index.
+    """
+    landmark_index = _check_landmark_index(landmark_index)
+    indptr, indices = _tesselation_incidence()
+    return indices[indptr[landmark_index] : indptr[landmark_index + 1]]
+
+
+def gather_edge_endpoints(
+    landmarks: np.ndarray, edges: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+  """Gathers the start and end landmark of every edge at once.
+
+  This replaces a Python loop such as
+  `for c in connections: p0, p1 = landmarks[c.start], landmarks[c.end]` with
+  two NumPy gathers.
+
+  Args:
+    landmarks: (N, D) array with one row per landmark, e.g. x, y and z.
+    edges: (E, 2) array of `[start, end]` landmark indices, or one of the
+      `FaceLandmarksConnections.FACE_LANDMARKS_*` connection lists.
+
+  Returns:
+    The (E, D) arrays of start landmarks and of end landmarks.
+  """
+  edges = np.asarray(edges)
+  return landmarks[edges[:, 0]], landmarks[edges[:, 1]]
@@ -0,0 +1,198 @@
+# Copyright 2023 The MediaPipe Authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""CLI tool to regenerate the encoded tesselation in _face_landmarker_data.py.
+
+The tesselation literals in `_face_landmarker_data.py` must not be edited by
+hand. By default this tool reads the current triangles from the module itself
+and rewrites its literals, so the module is the ground truth; a new mesh can be
+supplied as a text file with three landmark indices per line instead. The
+unique edges are always recomputed from the triangles.
+
+It is a development tool in `tools/`, which is not part of the pip package.
+
+Example:
+  # Export the current triangles, edit them, then regenerate the module.
+  bazel run //mediapipe/tasks/python/vision:gen_face_landmarker_data -- \
+      --export_triangles_path=/tmp/tris.txt
+  bazel run //mediapipe/tasks/python/vision:gen_face_landmarker_data -- \
+      --triangles_path=/tmp/tris.txt
+"""
+
+import ast
+import os
+from typing import Mapping
+import zlib
+
+from absl import app
+from absl import flags
+import numpy as np
+
+from mediapipe.tasks.python.vision import _face_landmarker_data
+
+FLAGS = flags.FLAGS
+flags.DEFINE_string(
+    'triangles_path', None,
+    'Path to a text file with the triangles, three landmark indices per line. '
+    'Defaults to the triangles currently in the data module.')
+flags.DEFINE_string(
+    'export_triangles_path', None,
+    'If set, writes the current triangles to this text file and exits.')
+flags.DEFINE_string(
+    'output_path', None,
+    'Path to the data module to rewrite. Defaults to the module in the source '
+    'tree under `bazel run`, and to the imported module otherwise.')
+
+_NUM_FACE_LANDMARKS = 478
+_DATA_MODULE_PATH = 'mediapipe/tasks/python/vision/_face_landmarker_data.py'
+_LITERAL_INDENT = '    '
+_MAX_LINE_LENGTH = 80
+
+
+def _encode_varints(values: np.ndarray) -> bytes:
+  """Encodes non-negative integers as zlib-compressed LEB128 varints."""
+  encoded = bytearray()
+  for value in values.tolist():
+    while value >= 0x80:
+      encoded.append((value & 0x7F) | 0x80)
+      value >>= 7
+    encoded.append(value)
+  return zlib.compress(bytes(encoded), 9)
+
+
+def _encode_triangles(triangles: np.ndarray) -> bytes:
+  deltas = np.diff(triangles.astype(np.int64).ravel(), prepend=0)
+  return _encode_varints((deltas << 1) ^ (deltas >> 63))
+
+
+def _encode_unique_edges(edges: np.ndarray) -> bytes:
+  edges = edges.astype(np.int64)
+  counts = np.bincount(edges[:, 0], minlength=_NUM_FACE_LANDMARKS)
+  is_first = np.diff(edges[:, 0], prepend=-1) != 0
+  gaps = np.where(
+      is_first, edges[:, 1] - edges[:, 0], np.diff(edges[:, 1], prepend=0)
+  )
+  return _encode_varints(np.concatenate([counts, gaps]))
+
+
+def _unique_edges(triangles: np.ndarray) -> np.ndarray:
+  """Returns the sorted `(min, max)` undirected edges of the triangles."""
+  edges = triangles[:, [0, 1, 1, 2, 2, 0]].reshape(-1, 2)
+  return np.unique(np.sort(edges, axis=1), axis=0)
+
+
+def _format_bytes_literal(data: bytes) -> str:
+  """Formats bytes as a parenthesized literal wrapped at 80 columns."""
+  tokens = []
+  for byte in data:
+    char = chr(byte)
+    if char in '\\\'':
+      tokens.append('\\' + char)
+    elif char == '\t':
+      tokens.append('\\t')
+    elif char == '\n':
+      tokens.append('\\n')
+    elif char == '\r':
+      tokens.append('\\r')
+    elif 0x20 <= byte < 0x7F:
+      tokens.append(char)
+    else:
+      tokens.append(f'\\x{byte:02x}')
+  max_length = _MAX_LINE_LENGTH - len(_LITERAL_INDENT) - len("b''")
+  lines, line = [], ''
+  for token in tokens:
+    if len(line) + len(token) > max_length:
+      lines.append(line)
+      line = ''
+    line += token
+  if line:
+    lines.append(line)
+  body = '\n'.join(f"{_LITERAL_INDENT}b'{line}'" for line in lines)
+  return f'(\n{body}\n)'
+
+
+def _replace_literals(source: str, literals: Mapping[str, str]) -> str:
+  """Replaces the values of module-level assignments in the source."""
+  lines = source.splitlines(keepends=True)
+  spans = []
+  for node in ast.parse(source).body:
+    if (isinstance(node, ast.Assign) and len(node.targets) == 1 and
+        isinstance(node.targets[0], ast.Name) and
+        node.targets[0].id in literals):
+      spans.append((node.lineno, node.end_lineno, node.targets[0].id))
+  if len(spans) != len(literals):
+    raise ValueError('The data module is missing some of the literals.')
+  # Replaces from the bottom so that earlier line numbers stay valid.
+  for start, end, name in sorted(spans, reverse=True):
+    lines[start - 1:end] = [f'{name} = {literals[name]}\n']
+  return ''.join(lines)
+
+
+def _load_triangles(path: str) -> np.ndarray:
+  triangles = np.loadtxt(path, dtype=np.int64, ndmin=2)
+  if triangles.shape[1] != 3:
+    raise ValueError(f'Expected three landmark indices per line in {path}.')
+  if triangles.min() < 0 or triangles.max() >= _NUM_FACE_LANDMARKS:
+    raise ValueError(f'Landmark index out of range in {path}.')
+  if np.any(triangles == np.roll(triangles, 1, axis=1)):
+    raise ValueError(f'Found a degenerate triangle in {path}.')
+  return triangles.astype(np.uint16)
+
+
+def main(_):
+  if FLAGS.export_triangles_path:
+    np.savetxt(FLAGS.export_triangles_path,
+               _face_landmarker_data.decode_triangles(), fmt='%d')
+    return
+
+  if FLAGS.triangles_path:
+    triangles = _load_triangles(FLAGS.triangles_path)
+  else:
+    triangles = _face_landmarker_data.decode_triangles()
+  unique_edges = _unique_edges(triangles)
+
+  output_path = FLAGS.output_path
+  if output_path is None:
+    # `bazel run` runs the tool from its runfiles, not from the source tree.
+    workspace = os.environ.get('BUILD_WORKSPACE_DIRECTORY')
+    if workspace:
+      output_path = os.path.join(workspace, _DATA_MODULE_PATH)
+    else:
+      output_path = _face_landmarker_data.__file__
+
+  with open(output_path) as f:
+    source = f.read()
+  source = _replace_literals(source, {
+      '_TRIANGLES_ENCODED': _format_bytes_literal(
+          _encode_triangles(triangles)),
+      '_UNIQUE_EDGES_ENCODED': _format_bytes_literal(
+          _encode_unique_edges(unique_edges)),
+  })
+
+  # Checks that the new module decodes back to the same arrays.
+  namespace = {}
+  exec(compile(source, output_path, 'exec'), namespace)  # pylint: disable=exec-used
+  if not (
+      np.array_equal(namespace['decode_triangles'](), triangles) and
+      np.array_equal(namespace['decode_unique_edges'](), unique_edges)):
+    raise ValueError('The encoded tesselation does not round-trip.')
+
+  with open(output_path, 'w') as f:
+    f.write(source)
+  print(f'Wrote {len(triangles)} triangles and {len(unique_edges)} unique '
+        f'edges to {os.path.abspath(output_path)}.')
+
+
+if __name__ == '__main__':
+  app.run(main)